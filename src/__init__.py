@@ -1 +0,0 @@
-"""Source package root"""
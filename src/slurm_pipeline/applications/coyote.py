@@ -7,12 +7,32 @@ Uses clean composition and inheritance from base job classes
 
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 from pathlib import Path
 
 from ..core.single_job import SingleJob
 from ..core.array_job import ArrayJob
 
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # optional speedup, see the "fast" extra
+    _HAVE_ORJSON = False
+
+# Common parameters that are pipeline settings rather than coyote arguments
+_NON_COYOTE_PARAMS = frozenset({"basename", "iterations"})
+
+
+def _dump_json(data: Mapping[str, Any]) -> bytes:
+    """Serialize parameters as indented JSON bytes"""
+    # Config sections are read-only mapping proxies, which neither
+    # serializer accepts
+    data = dict(data)
+    if _HAVE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 class CoyoteJob(SingleJob, ArrayJob):
     """
@@ -35,6 +55,11 @@ class CoyoteJob(SingleJob, ArrayJob):
         """
         # Set coyote-specific attributes first (needed by setup_command_builder)
         self.coyote_binary = str(Path(coyote_binary).resolve())
+        # Memoized lookups, filled on first use
+        self._cfcache_path: Optional[str] = None
+        self._worker_source: Optional[str] = None
+        # Set once create_parameter_files has written the JSON files
+        self._param_files_written = False
         # Initialize both parent classes (SingleJob calls BaseJob.__init__)
         SingleJob.__init__(self, config_parser, working_dir)
         self.nprocs = int(self.slurm_config.get("coyote_nprocs", 40))
@@ -57,17 +82,20 @@ class CoyoteJob(SingleJob, ArrayJob):
         """Setup coyote-specific command builder"""
         self.command_builder.set_executable(self.coyote_binary)
         self.command_builder.add_base_args(help="noprompt")
-        # Add common parameters
-        for key, value in self.common_params.items():
-            if key not in ["basename", "iterations"]:  # Skip non-coyote params
-                self.command_builder.add_base_args(**{key: value})
+        # Add common parameters, skipping non-coyote params
+        self.command_builder.add_base_args(
+            **{
+                key: value
+                for key, value in self.common_params.items()
+                if key not in _NON_COYOTE_PARAMS
+            }
+        )
         # Add app-specific parameters
-        for key, value in self.app_params.items():
-            self.command_builder.add_base_args(**{key: value})
+        self.command_builder.add_base_args(**self.app_params)
         # Add mode-specific arguments
         cfcache_path = self.get_cfcache_path()
-        self.command_builder.add_mode_args("dryrun", cfcache=cfcache_path)
-        self.command_builder.add_mode_args("fillcf", cfcache=cfcache_path)
+        for mode in ("dryrun", "fillcf"):
+            self.command_builder.add_mode_args(mode, cfcache=cfcache_path)
 
     def setup_data_environment(self) -> None:
         """Set up data directory and CASAPATH environment"""
@@ -87,7 +115,7 @@ class CoyoteJob(SingleJob, ArrayJob):
         self.validate_requirements()
 
         # Check coyote binary
-        if not Path(self.coyote_binary).exists():
+        if not os.path.isfile(self.coyote_binary):
             raise FileNotFoundError(f"Coyote binary not found: {self.coyote_binary}")
 
         # Check required SLURM parameters
@@ -102,12 +130,12 @@ class CoyoteJob(SingleJob, ArrayJob):
 
     def get_cfcache_path(self) -> str:
         """Get absolute path to CF cache directory"""
-        cfcache_name = self.app_params.get("cfcache", "ps.cf")
+        if self._cfcache_path is None:
+            cfcache_name = self.app_params.get("cfcache", "ps.cf")
 
-        if Path(cfcache_name).is_absolute():
-            return str(cfcache_name)
+            self._cfcache_path = self.file_manager.get_working_path(cfcache_name)
 
-        return str(self.file_manager.working_dir / cfcache_name)
+        return self._cfcache_path
 
     def create_worker_module(self) -> str:
         """Create the coyote_worker.py module in working directory"""
@@ -123,18 +151,24 @@ class CoyoteJob(SingleJob, ArrayJob):
 
     def _find_worker_module(self) -> str:
         """Find the coyote_worker.py reference implementation"""
+        if self._worker_source is not None:
+            return self._worker_source
+
         # Look in common locations
+        package_dir = os.path.dirname(os.path.abspath(__file__))
         possible_locations = [
-            Path(__file__).parent.parent
-            / "workers"
-            / "coyote_worker.py",  # Package location
-            Path.cwd() / "coyote_worker.py",  # Current directory
-            Path(__file__).parent / "coyote_worker.py",  # Same directory as this file
+            os.path.join(
+                os.path.dirname(package_dir), "workers", "coyote_worker.py"
+            ),  # Package location
+            os.path.join(os.getcwd(), "coyote_worker.py"),  # Current directory
+            os.path.join(package_dir, "coyote_worker.py"),  # Same directory as this file
         ]
 
+        # One stat per candidate; also rejects directories with a matching name
         for location in possible_locations:
-            if location.exists():
-                return str(location)
+            if os.path.isfile(location):
+                self._worker_source = location
+                return self._worker_source
 
         raise FileNotFoundError(
             "Could not find coyote_worker.py. Please ensure it's in the workers directory "
@@ -143,13 +177,16 @@ class CoyoteJob(SingleJob, ArrayJob):
 
     def create_parameter_files(self) -> None:
         """Create JSON parameter files for the worker module"""
-        # Write common parameters
-        with open(self.common_params_file, "w") as f:
-            json.dump(self.common_params, f, indent=2)
-
-        # Write app parameters
-        with open(self.app_params_file, "w") as f:
-            json.dump(self.app_params, f, indent=2)
+        # Serialize up front and write each file in one unbuffered call
+        self.file_manager.write_file(
+            self.common_params_file.name,
+            _dump_json(self.common_params),
+        )
+        self.file_manager.write_file(
+            self.app_params_file.name,
+            _dump_json(self.app_params),
+        )
+        self._param_files_written = True
 
     def build_worker_command(self, mode: str) -> List[str]:
         """Build command to execute coyote_worker.py"""
@@ -162,10 +199,9 @@ class CoyoteJob(SingleJob, ArrayJob):
             "mode": mode,
         }
 
-        # Add parameter files if they exist
-        if self.common_params_file.exists():
+        # Add parameter files once they have been written
+        if self._param_files_written:
             args["common_params_file"] = str(self.common_params_file)
-        if self.app_params_file.exists():
             args["app_params_file"] = str(self.app_params_file)
 
         return self.command_builder.build_python_command(
@@ -210,9 +246,9 @@ class CoyoteJob(SingleJob, ArrayJob):
         output_log, error_log = self.file_manager.get_log_paths(
             job_name, array_job=True
         )
-        job_config.update(
-            {"output": output_log, "error": error_log, "array_range": array_range}
-        )
+        job_config["output"] = output_log
+        job_config["error"] = error_log
+        job_config["array_range"] = array_range
         
         # Add dependency if specified
         if dependency:
@@ -7,11 +7,12 @@ from .base_job import BaseJob
 from .single_job import SingleJob
 from .array_job import ArrayJob
 from .gpu_job import GPUJob
+from .fast_config_parser import FastConfigParser
 from .config_parser import ConfigParser
 from .pipeline_driver import PipelineDriver
 
 __all__ = [
     "CommandBuilder", "ResourceConfig", "FileManager", "ScriptGenerator",
     "BaseJob", "SingleJob", "ArrayJob", "GPUJob",
-    "ConfigParser", "PipelineDriver"
+    "FastConfigParser", "ConfigParser", "PipelineDriver"
 ]
\ No newline at end of file
@@ -29,7 +29,13 @@ class ArrayJob(BaseJob):
         walltime_key: Optional[str] = None,
         environment_setup: str = "",
     ) -> Dict[str, Any]:
-        """Generate an array SLURM job"""
+        """
+        Generate an array SLURM job
+
+        command_args reach the script unquoted, so values such as
+        {"procid": "$SLURM_ARRAY_TASK_ID"} expand per task; see
+        CommandBuilder.build_command_str.
+        """
 
         # Get base job configuration
         job_config = self.get_base_job_config(job_name, memory_key, walltime_key)
@@ -38,16 +44,16 @@ class ArrayJob(BaseJob):
         output_log, error_log = self.file_manager.get_log_paths(
             job_name, array_job=True
         )
-        job_config.update(
-            {"output": output_log, "error": error_log, "array_range": array_range}
-        )
+        job_config["output"] = output_log
+        job_config["error"] = error_log
+        job_config["array_range"] = array_range
 
         # Add dependency if specified
         if dependency:
             job_config["dependency"] = f"afterok:{dependency}"
 
         # Build command
-        command = self.command_builder.build_command(mode, command_args)
+        command = self.command_builder.build_command_str(mode, command_args)
 
         # Generate script
         script_content = self.script_generator.generate_script(
@@ -12,6 +12,7 @@ BaseJob (abstract) - defines interface, uses composition
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple, Any
 from .components import CommandBuilder, ResourceConfig, FileManager, ScriptGenerator
+from .config_parser import REQUIRED_COMMON, REQUIRED_SLURM, missing_required
 
 
 class BaseJob(ABC):
@@ -33,6 +34,9 @@ class BaseJob(ABC):
         self.script_generator = ScriptGenerator(self.resource_config, self.file_manager)
         self.command_builder = CommandBuilder()
 
+        # Job-invariant SLURM settings, built on first use
+        self._base_config_template: Optional[Dict[str, str]] = None
+
         # Initialize command builder with app-specific setup
         self.setup_command_builder()
 
@@ -54,31 +58,31 @@ class BaseJob(ABC):
     def validate_requirements(self) -> None:
         """Validate that all required parameters are present"""
         # Base validation - can be extended by subclasses
-        required_common = ["vis", "basename"]
-        missing_common = [p for p in required_common if p not in self.common_params]
-
-        required_slurm = ["account", "email"]
-        missing_slurm = [p for p in required_slurm if p not in self.slurm_config]
+        missing = missing_required(REQUIRED_COMMON, self.common_params)
+        missing += missing_required(REQUIRED_SLURM, self.slurm_config)
 
-        if missing_common or missing_slurm:
-            missing = missing_common + missing_slurm
+        if missing:
             raise ValueError(f"Missing required parameters: {missing}")
 
     def get_base_job_config(
         self, job_name: str, memory_key: str, walltime_key: Optional[str] = None
     ) -> Dict[str, str]:
         """Get base SLURM job configuration"""
+        if self._base_config_template is None:
+            self._base_config_template = {
+                "account": self.slurm_config["account"],
+                "mail_user": self.slurm_config["email"],
+                "mail_type": "FAIL",
+                "nodes": "1",
+                "ntasks_per_node": "1",
+            }
+
         output_log, error_log = self.file_manager.get_log_paths(job_name)
 
-        return {
-            "job_name": job_name,
-            "time": self.resource_config.get_walltime(walltime_key),
-            "mem": self.resource_config.get_memory(memory_key),
-            "account": self.slurm_config["account"],
-            "mail_user": self.slurm_config["email"],
-            "mail_type": "FAIL",
-            "output": output_log,
-            "error": error_log,
-            "nodes": "1",
-            "ntasks_per_node": "1",
-        }
+        job_config = self._base_config_template.copy()
+        job_config["job_name"] = job_name
+        job_config["time"] = self.resource_config.get_walltime(walltime_key)
+        job_config["mem"] = self.resource_config.get_memory(memory_key)
+        job_config["output"] = output_log
+        job_config["error"] = error_log
+        return job_config
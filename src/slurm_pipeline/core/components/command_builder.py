@@ -9,6 +9,16 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import os
+import shlex
+
+
+def _format_args(args: Dict) -> List[str]:
+    """Format non-empty arguments as key=value strings"""
+    return [
+        f"{key}={value}"
+        for key, value in args.items()
+        if value is not None and value != ""
+    ]
 
 
 class CommandBuilder:
@@ -18,15 +28,27 @@ class CommandBuilder:
         self.executable: Optional[str] = None
         self.base_args: Dict[str, str] = {}
         self.mode_args: Dict[str, Dict[str, str]] = {}
+        # Shell-quoted executable + base args, shared by every mode
+        self._base_cmd_str: Optional[str] = None
+        # mode -> formatted executable + base + mode args, built on first use
+        self._cmd_cache: Dict[Optional[str], Tuple[str, ...]] = {}
 
     def set_executable(self, executable: str) -> "CommandBuilder":
         """Set the main executable path"""
-        self.executable = str(Path(executable).resolve())
+        # Absolute paths (e.g. an already-resolved binary) skip the realpath walk
+        if os.path.isabs(executable):
+            self.executable = str(executable)
+        else:
+            self.executable = str(Path(executable).resolve())
+        self._base_cmd_str = None
+        self._cmd_cache.clear()
         return self
 
     def add_base_args(self, **kwargs: str) -> "CommandBuilder":
         """Add base arguments that apply to all modes"""
         self.base_args.update(kwargs)
+        self._base_cmd_str = None
+        self._cmd_cache.clear()
         return self
 
     def add_mode_args(self, mode: str, **kwargs: str) -> "CommandBuilder":
@@ -34,6 +56,7 @@ class CommandBuilder:
         if mode not in self.mode_args:
             self.mode_args[mode] = {}
         self.mode_args[mode].update(kwargs)
+        self._cmd_cache.pop(mode, None)
         return self
 
     def build_command(
@@ -43,33 +66,58 @@ class CommandBuilder:
         if not self.executable:
             raise ValueError("Executable not set")
 
-        cmd = [self.executable]
+        cached = self._cmd_cache.get(mode)
+        if cached is None:
+            cached = (self.executable, *_format_args(self.base_args))
+            # Add mode-specific arguments
+            if mode and mode in self.mode_args:
+                cached += tuple(_format_args(self.mode_args[mode]))
+            self._cmd_cache[mode] = cached
 
-        # Add base arguments
-        for key, value in self.base_args.items():
-            if value is not None and value != "":
-                cmd.append(f"{key}={value}")
-
-        # Add mode-specific arguments
-        if mode and mode in self.mode_args:
-            for key, value in self.mode_args[mode].items():
-                if value is not None and value != "":
-                    cmd.append(f"{key}={value}")
+        # Fresh list each call so callers may extend it
+        cmd = list(cached)
 
         # Add extra arguments
         if extra_args:
-            for key, value in extra_args.items():
-                if value is not None and value != "":
-                    cmd.append(f"{key}={value}")
+            cmd += _format_args(extra_args)
 
         return cmd
 
+    def build_command_str(
+        self, mode: Optional[str] = None, extra_args: Optional[Dict] = None
+    ) -> str:
+        """
+        Build command as a string ready for a job script
+
+        The executable, base and mode arguments come from the .def file and
+        are shell-quoted, so spaces and globs in values survive. extra_args
+        are appended unquoted, as they always were, so the script's shell
+        still expands them (e.g. procid=$SLURM_ARRAY_TASK_ID); callers must
+        quote any extra value that contains spaces or glob characters.
+        """
+        if not self.executable:
+            raise ValueError("Executable not set")
+
+        if self._base_cmd_str is None:
+            self._base_cmd_str = shlex.join(
+                [self.executable, *_format_args(self.base_args)]
+            )
+
+        parts = [self._base_cmd_str]
+        if mode and mode in self.mode_args:
+            parts += map(shlex.quote, _format_args(self.mode_args[mode]))
+        if extra_args:
+            parts += _format_args(extra_args)
+
+        return " ".join(parts)
+
     def build_python_command(self, script_path: str, **kwargs: str) -> List[str]:
         """Build Python command with --arg value format"""
         cmd = ["python3", str(script_path)]
-
-        for key, value in kwargs.items():
-            if value is not None:
-                cmd.extend([f"--{key}", str(value)])
-
+        cmd += [
+            arg
+            for key, value in kwargs.items()
+            if value is not None
+            for arg in (f"--{key}", str(value))
+        ]
         return cmd
@@ -6,11 +6,109 @@ These classes handle specific aspects of job creation:
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import logging
 import os
 import shutil
 
+logger = logging.getLogger(__name__)
+
+# Buffer size for the read/write copy fallback
+_COPY_BUFSIZE = 1024 * 1024
+
+# Concurrent file copies when staging a data tree
+_COPY_WORKERS = 16
+
+
+def _write_fd(path: Path, data: bytes, mode: int) -> None:
+    """Write data to path through a single file descriptor and set its mode"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # fchmod on the open descriptor avoids a second path lookup and
+        # applies the mode even when the file already existed
+        os.fchmod(fd, mode)
+    finally:
+        os.close(fd)
+
+
+def _copy_file(source: str, target: str, mode: Optional[int] = None) -> str:
+    """
+    Copy file contents without metadata
+
+    Uses os.sendfile so the data never passes through user space, falling
+    back to a large-buffer read/write loop where sendfile can't target
+    regular files.
+    """
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        # Opening the target with O_TRUNC would empty a source that is the
+        # same file, so refuse like shutil.copy does
+        src_stat = os.fstat(src_fd)
+        try:
+            same_file = os.path.samestat(src_stat, os.stat(target))
+        except FileNotFoundError:
+            same_file = False
+        if same_file:
+            raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+
+        dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = src_stat.st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                if offset:
+                    raise
+                while True:
+                    chunk = os.read(src_fd, _COPY_BUFSIZE)
+                    if not chunk:
+                        break
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(dst_fd, view):]
+            if mode is not None:
+                os.fchmod(dst_fd, mode)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    return target
+
+
+def _copy_tree(source: Path, target: Path, max_workers: int = _COPY_WORKERS) -> None:
+    """
+    Copy a directory tree, fanning the per-file copies out to a thread pool
+
+    Directories are created up front so the copies only contend on file
+    creation, which is where shared filesystems spend their latency.
+    """
+    pairs: List[Tuple[str, str]] = []
+    for dirpath, _dirnames, filenames in os.walk(source, followlinks=True):
+        target_dir = os.path.join(target, os.path.relpath(dirpath, source))
+        os.makedirs(target_dir, exist_ok=True)
+        pairs.extend(
+            (os.path.join(dirpath, name), os.path.join(target_dir, name))
+            for name in filenames
+        )
+
+    if not pairs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as executor:
+        # Consuming the results re-raises the first copy failure
+        for _ in executor.map(lambda pair: _copy_file(*pair), pairs):
+            pass
+
 
 class FileManager:
     """Handles file operations and naming conventions"""
@@ -20,10 +118,13 @@ class FileManager:
         self.basename = basename
         self.logs_dir = self.working_dir / "logs"
         self.data_dir = self.working_dir / "data"
+        # String forms for getters that only ever return strings
+        self._working_dir_str = str(self.working_dir)
+        self._logs_dir_str = str(self.logs_dir)
 
-        # Ensure directories exist
-        self.working_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(exist_ok=True)
+        # Ensure directories exist; creating logs_dir with parents also
+        # creates working_dir, so it needs no separate mkdir
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir.mkdir(exist_ok=True)
 
     def get_iteration_filename(self, filetype: str, iteration: int = 0) -> str:
@@ -32,28 +133,37 @@ class FileManager:
             return f"{self.basename}_iter{iteration:03d}.{filetype}"
         return f"{self.basename}.{filetype}"
 
+    def get_working_path(self, filename: str) -> str:
+        """
+        Get path string for a file in the working directory
+
+        Absolute filenames pass through unchanged.
+        """
+        return os.path.join(self._working_dir_str, filename)
+
     def get_log_paths(
         self, job_prefix: str, array_job: bool = False
     ) -> Tuple[str, str]:
         """Generate log file paths"""
         if array_job:
-            output_log = str(self.logs_dir / f"{job_prefix}_%A_%a.out")
-            error_log = str(self.logs_dir / f"{job_prefix}_%A_%a.err")
+            log_stem = os.path.join(self._logs_dir_str, f"{job_prefix}_%A_%a")
         else:
-            output_log = str(self.logs_dir / f"{job_prefix}_%j.out")
-            error_log = str(self.logs_dir / f"{job_prefix}_%j.err")
+            log_stem = os.path.join(self._logs_dir_str, f"{job_prefix}_%j")
+
+        output_log = log_stem + ".out"
+        error_log = log_stem + ".err"
 
         return output_log, error_log
 
+    def write_file(self, filename: str, data: bytes, mode: int = 0o644) -> str:
+        """Write raw bytes to a file in the working directory"""
+        file_path = self.working_dir / filename
+        _write_fd(file_path, data, mode)
+        return str(file_path)
+
     def write_script(self, content: str, filename: str) -> str:
         """Write script to file and make executable"""
-        script_path = self.working_dir / filename
-
-        with open(script_path, "w") as f:
-            f.write(content)
-
-        script_path.chmod(0o755)
-        return str(script_path)
+        return self.write_file(filename, content.encode(), 0o755)
 
     def copy_worker_module(self, source_path: str, target_name: str) -> str:
         """Copy worker module to working directory"""
@@ -63,8 +173,7 @@ class FileManager:
         if not source.exists():
             raise FileNotFoundError(f"Worker module not found: {source}")
 
-        shutil.copy2(source, target)
-        target.chmod(0o755)
+        _copy_file(str(source), str(target), 0o755)
 
         return str(target)
     
@@ -85,12 +194,12 @@ class FileManager:
             package_root = Path(__file__).parent.parent.parent.parent.parent
             source_data = package_root / "data"
         
-        if not source_data.exists():
+        if not os.path.isdir(source_data):
             raise FileNotFoundError(f"Source data directory not found: {source_data}")
         
         # Check for required VLA surface file
         vla_surface_file = source_data / "nrao" / "VLA" / "VLA.surface"
-        if not vla_surface_file.exists():
+        if not os.path.isfile(vla_surface_file):
             raise FileNotFoundError(f"Required VLA surface file not found: {vla_surface_file}")
         
         # Copy entire data directory structure
@@ -98,21 +207,16 @@ class FileManager:
         if target_data.exists():
             shutil.rmtree(target_data)
         
-        shutil.copytree(source_data, target_data)
-        
-        # Verify the copy was successful
-        target_vla_surface = target_data / "nrao" / "VLA" / "VLA.surface"
-        if not target_vla_surface.exists():
-            raise RuntimeError(f"Failed to copy VLA surface file to: {target_vla_surface}")
-        
-        print(f"Data directory set up at: {target_data}")
-        print(f"VLA surface file available at: {target_vla_surface}")
-        
+        # _copy_tree raises on any failed copy, so no post-copy check is needed
+        _copy_tree(source_data, target_data)
+
+        logger.debug("Data directory set up at: %s", target_data)
+
         return str(target_data)
     
     def get_casapath(self) -> str:
         """Get CASAPATH environment variable value"""
-        return str(self.data_dir)
+        return os.path.join(self._working_dir_str, "data")
     
     def validate_data_setup(self) -> bool:
         """
@@ -6,9 +6,10 @@ These classes handle specific aspects of job creation:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import os
+import shlex
 from .resource_config import ResourceConfig
 from .file_manager import FileManager
 
@@ -16,80 +17,73 @@ from .file_manager import FileManager
 class ScriptGenerator:
     """Generates SLURM scripts from components"""
 
-    # Base SLURM script template
-    SLURM_TEMPLATE = """#!/bin/bash
-{directives}
-
-{environment_setup}
-
-{command}
-"""
+    # job_config key -> sbatch option, in the order directives are emitted
+    DIRECTIVE_MAP = (
+        ("export", "export"),
+        ("chdir", "chdir"),
+        ("time", "time"),
+        ("mem", "mem"),
+        ("nodes", "nodes"),
+        ("ntasks_per_node", "ntasks-per-node"),
+        ("output", "output"),
+        ("error", "error"),
+        ("job_name", "job-name"),
+        ("account", "account"),
+        ("mail_user", "mail-user"),
+        ("mail_type", "mail-type"),
+        ("array_range", "array"),
+        ("dependency", "dependency"),
+        ("constraint", "constraint"),
+        ("gres", "gres"),
+    )
+
+    __slots__ = ("resource_config", "file_manager", "_chdir_str")
 
     def __init__(self, resource_config: ResourceConfig, file_manager: FileManager) -> None:
         self.resource_config = resource_config
         self.file_manager = file_manager
+        # Every script runs from the working directory
+        self._chdir_str = str(file_manager.working_dir)
 
     def generate_slurm_directives(self, job_config: Dict[str, str]) -> str:
         """Generate SLURM directive lines"""
-        directives = []
-        # Standard directives
-        standard_keys = [
-            "export",
-            "chdir",
-            "time",
-            "mem",
-            "nodes",
-            "ntasks_per_node",
-            "output",
-            "error",
-            "job_name",
-            "account",
-            "mail_user",
-            "mail_type",
-        ]
-
-        for key in standard_keys:
-            if key in job_config and job_config[key]:
-                directive_key = key.replace("_", "-")  # mail_user -> mail-user
-                directives.append(f"#SBATCH --{directive_key}={job_config[key]}")
-
-        # Special directives
-        if "array_range" in job_config:
-            directives.append(f"#SBATCH --array={job_config['array_range']}")
+        return "\n".join(
+            f"#SBATCH --{directive}={value}"
+            for key, directive in self.DIRECTIVE_MAP
+            if (value := job_config.get(key))
+        )
 
-        if "dependency" in job_config and job_config["dependency"]:
-            directives.append(f"#SBATCH --dependency={job_config['dependency']}")
+    def render_header(self, job_config: Dict[str, str]) -> str:
+        """Render the shebang and SBATCH directive block"""
+        # Inject the working directory without mutating the caller's dict
+        directives = self.generate_slurm_directives(
+            {**job_config, "chdir": self._chdir_str}
+        )
+        return f"#!/bin/bash\n{directives}\n"
 
-        if "constraint" in job_config:
-            directives.append(f"#SBATCH --constraint={job_config['constraint']}")
+    def render_body(
+        self, command: Union[List[str], str], environment_setup: str = ""
+    ) -> str:
+        """
+        Render the environment setup and command block
 
-        if "gres" in job_config:
-            directives.append(f"#SBATCH --gres={job_config['gres']}")
+        command may be an argument list, which is shell-quoted here, or a
+        string that is written as is (see CommandBuilder.build_command_str).
+        """
+        if isinstance(command, str):
+            command_str = command
+        else:
+            command_str = shlex.join(command)
 
-        return "\n".join(directives)
+        return f"\n{environment_setup}\n\n{command_str}\n"
 
     def generate_script(
         self,
         job_config: Dict[str, str],
-        command: List[str],
+        command: Union[List[str], str],
         environment_setup: str = "",
     ) -> str:
         """Generate complete SLURM script"""
-
-        # Add working directory to job config
-        job_config["chdir"] = str(self.file_manager.working_dir)
-
-        # Generate directives
-        directives = self.generate_slurm_directives(job_config)
-
-        # Build command string
-        command_str = " ".join(command)
-
-        # Generate script
-        script = self.SLURM_TEMPLATE.format(
-            directives=directives,
-            environment_setup=environment_setup,
-            command=command_str,
+        return self.render_header(job_config) + self.render_body(
+            command, environment_setup
         )
-
-        return script
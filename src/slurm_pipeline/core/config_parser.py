@@ -3,61 +3,233 @@
 src/slurm_pipeline/core/config_parser.py
 
 Configuration file parser for .def files
-Uses Python's built-in configparser for robust .ini-style file handling
+Uses a lightweight regex parser by default, with Python's built-in
+configparser available for full .ini syntax
 """
 
 import configparser
+import mmap
 import os
-from typing import Dict, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, TextIO, Union
 from pathlib import Path
 
+from .fast_config_parser import FastConfigParser
+
+# GPU type -> resource specifications; read-only, get_gpu_resources hands
+# out copies
+_GPU_RESOURCES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'h200': MappingProxyType({
+        'constraint': 'h200',
+        'cpu_mem_per_gpu': '128GB',
+        'gpu_mem': '141GB',
+        'default_gpu_walltime': '1-00:00:00'
+    }),
+    'l40s': MappingProxyType({
+        'constraint': 'l40s',
+        'cpu_mem_per_gpu': '64GB',
+        'gpu_mem': '48GB',
+        'default_gpu_walltime': '1-00:00:00'
+    }),
+    'a100': MappingProxyType({
+        'constraint': 'a100',
+        'cpu_mem_per_gpu': '64GB',
+        'gpu_mem': '80GB',
+        'default_gpu_walltime': '1-00:00:00'
+    }),
+    'v100s': MappingProxyType({
+        'constraint': 'v100s',
+        'cpu_mem_per_gpu': '32GB',
+        'gpu_mem': '32GB',
+        'default_gpu_walltime': '1-00:00:00'
+    })
+})
+_GPU_TYPES = tuple(_GPU_RESOURCES)
+
+# Sections and parameters every .def file must define. Missing ones are
+# found with a set difference and reported in _REPORT_ORDER, since
+# frozensets have no order
+REQUIRED_SECTIONS = frozenset({'common', 'slurm'})
+REQUIRED_COMMON = frozenset({'vis', 'basename'})
+REQUIRED_SLURM = frozenset({'account', 'email'})
+_REPORT_ORDER = ('common', 'slurm', 'vis', 'basename', 'account', 'email')
+
+
+def missing_required(required: FrozenSet[str], present: Mapping[str, Any]) -> List[str]:
+    """Return the names in required that present lacks, in _REPORT_ORDER"""
+    missing = required - present.keys()
+    return [name for name in _REPORT_ORDER if name in missing]
+
+
+_Parser = Union[configparser.RawConfigParser, FastConfigParser]
+_Snapshot = Mapping[str, Mapping[str, str]]
+
+# .def files larger than this are read through mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# Returned for application sections the .def file does not define
+_EMPTY_SECTION: Mapping[str, str] = MappingProxyType({})
+
+
+def _build_parser(text: str, source: str, strict: bool) -> _Parser:
+    """Parse .def content into a new parser object"""
+    config: _Parser
+    if strict:
+        config = configparser.RawConfigParser(interpolation=None)
+    else:
+        config = FastConfigParser()
+    config.read_string(text, source)
+    return config
+
+
+def _take_snapshot(config: _Parser) -> _Snapshot:
+    """
+    Take a read-only snapshot of every section of a parser
+
+    The snapshot may be shared by every ConfigParser built from the same
+    file, so it and each section in it are read-only views.
+    """
+    return MappingProxyType({
+        section: MappingProxyType(dict(config[section]))
+        for section in config.sections()
+    })
+
+
+def _read_def(path: str, size: int) -> str:
+    """
+    Read a .def file as text, mapping it into memory when it is large
+
+    Large files are decoded straight from the page cache instead of being
+    copied through a read buffer first.
+    """
+    if size <= _MMAP_THRESHOLD:
+        return Path(path).read_text(encoding="utf-8")
+
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        return str(mapped, "utf-8")
+
+
+@lru_cache(maxsize=64)
+def _parse_def(text: str, path: str, strict: bool) -> _Snapshot:
+    """
+    Parse .def file content, memoized on the content itself
+
+    The text is the cache key: its hash serves as the content digest and a
+    hit is confirmed by a full comparison, so an edit that keeps the file's
+    size and mtime (coarse timestamps on NFS) never returns a stale parse.
+    Only the read-only snapshot is cached; the parser object is mutable, so
+    each ConfigParser builds its own from the text when first asked for it.
+    """
+    return _take_snapshot(_build_parser(text, path, strict))
+
 
 class ConfigParser:
     """Parser for .def configuration files"""
 
-    def __init__(self, def_file_path: str) -> None:
+    def __init__(
+        self,
+        def_file_path: Union[str, Path],
+        strict: bool = False,
+        text: Optional[str] = None,
+    ) -> None:
         """
         Initialize parser with .def file path
         
         Args:
-            def_file_path: Path to the .def configuration file
+            def_file_path: Path to the .def configuration file, or just a
+                label for error messages when text is given
+            strict: Parse with the standard library configparser (full .ini
+                syntax and ParsingError messages) instead of FastConfigParser
+            text: Already-loaded .def content; skips reading from disk
             
         Raises:
             FileNotFoundError: If .def file doesn't exist
             ValueError: If required sections are missing
         """
-        self.def_file_path = Path(def_file_path).resolve()
-        
-        if not self.def_file_path.exists():
-            raise FileNotFoundError(f"Definition file not found: {self.def_file_path}")
-        
-        self.config = configparser.ConfigParser(interpolation=None)
-        self.config.read(str(self.def_file_path))
+        self._config: Optional[_Parser] = None
+        self._strict = strict
+        # Set by validate_required_params; the snapshot never changes after
+        # parsing, so one successful check holds for the parser's lifetime
+        self._validated = False
+        if text is None:
+            self.def_file_path = Path(def_file_path).resolve()
+
+            try:
+                stat = os.stat(self.def_file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Definition file not found: {self.def_file_path}")
+
+            self._text = _read_def(str(self.def_file_path), stat.st_size)
+            self._snapshot = _parse_def(self._text, str(self.def_file_path), strict)
+        else:
+            self.def_file_path = Path(def_file_path)
+            self._text = text
+            self._config = _build_parser(text, str(self.def_file_path), strict)
+            self._snapshot = _take_snapshot(self._config)
         
         # Validate required sections exist
         self.validate_required_sections()
+
+    @property
+    def config(self) -> _Parser:
+        """
+        Underlying parser object, private to this instance
+
+        Built from the .def text on first access. Changes made to it
+        are not reflected in the get_* methods, which read the snapshot
+        taken at parse time.
+        """
+        if self._config is None:
+            self._config = _build_parser(
+                self._text, str(self.def_file_path), self._strict
+            )
+        return self._config
+
+    @config.setter
+    def config(self, value: _Parser) -> None:
+        self._config = value
+
+    @classmethod
+    def from_text(
+        cls, text: str, origin: str = "<string>", strict: bool = False
+    ) -> "ConfigParser":
+        """
+        Build a parser from .def content already held in memory
+
+        Args:
+            text: Contents of a .def file
+            origin: Label used in place of a file path in messages
+            strict: Parse with the standard library configparser
+        """
+        return cls(origin, strict=strict, text=text)
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path], strict: bool = False) -> "ConfigParser":
+        """Build a parser by reading a .def file from disk"""
+        return cls(path, strict=strict)
         
     def validate_required_sections(self) -> None:
         """Validate that required sections exist in the .def file"""
-        required_sections = ['common', 'slurm']
-        missing_sections = [sec for sec in required_sections if not self.config.has_section(sec)]
+        missing_sections = missing_required(REQUIRED_SECTIONS, self._snapshot)
         
         if missing_sections:
             raise ValueError(f"Missing required sections in {self.def_file_path}: {missing_sections}")
     
-    def get_common_params(self) -> Dict[str, str]:
-        """Get parameters from [common] section"""
-        return dict(self.config['common'])
+    def get_common_params(self) -> Mapping[str, str]:
+        """Get parameters from [common] section (read-only)"""
+        return self._snapshot['common']
     
-    def get_slurm_config(self) -> Dict[str, str]:
-        """Get SLURM configuration from [slurm] section"""
-        return dict(self.config['slurm'])
+    def get_slurm_config(self) -> Mapping[str, str]:
+        """Get SLURM configuration from [slurm] section (read-only)"""
+        return self._snapshot['slurm']
     
-    def get_app_params(self, app_name: str) -> Dict[str, str]:
-        """Get parameters for specific application, returns empty dict if section missing"""
-        if self.config.has_section(app_name):
-            return dict(self.config[app_name])
-        return {}
+    def get_app_params(self, app_name: str) -> Mapping[str, str]:
+        """Get parameters for specific application (read-only), empty if section missing"""
+        return self._snapshot.get(app_name, _EMPTY_SECTION)
     
     def get_gpu_resources(self, gpu_type: str) -> Dict[str, str]:
         """
@@ -72,51 +244,23 @@ class ConfigParser:
         Raises:
             ValueError: If GPU type is not supported
         """
-        gpu_resources = {
-            'h200': {
-                'constraint': 'h200',
-                'cpu_mem_per_gpu': '128GB',
-                'gpu_mem': '141GB',
-                'default_gpu_walltime': '1-00:00:00'
-            },
-            'l40s': {
-                'constraint': 'l40s', 
-                'cpu_mem_per_gpu': '64GB',
-                'gpu_mem': '48GB',
-                'default_gpu_walltime': '1-00:00:00'
-            },
-            'a100': {
-                'constraint': 'a100',
-                'cpu_mem_per_gpu': '64GB', 
-                'gpu_mem': '80GB',
-                'default_gpu_walltime': '1-00:00:00'
-            },
-            'v100s': {
-                'constraint': 'v100s',
-                'cpu_mem_per_gpu': '32GB',
-                'gpu_mem': '32GB', 
-                'default_gpu_walltime': '1-00:00:00'
-            }
-        }
-        
-        if gpu_type not in gpu_resources:
-            available_types = list(gpu_resources.keys())
-            raise ValueError(f"Unsupported GPU type '{gpu_type}'. Available: {available_types}")
-        
-        return gpu_resources[gpu_type].copy()
+        try:
+            return dict(_GPU_RESOURCES[gpu_type])
+        except KeyError:
+            raise ValueError(
+                f"Unsupported GPU type '{gpu_type}'. Available: {list(_GPU_TYPES)}"
+            ) from None
     
     def validate_required_params(self) -> None:
         """Validate that essential parameters exist"""
-        common_params = self.get_common_params()
-        slurm_config = self.get_slurm_config()
-        
-        # Required common parameters
-        required_common = ['vis', 'basename']
-        missing_common = [param for param in required_common if param not in common_params]
+        if self._validated:
+            return
+
+        common_params = self._snapshot['common']
+        slurm_config = self._snapshot['slurm']
         
-        # Required SLURM parameters  
-        required_slurm = ['account', 'email']
-        missing_slurm = [param for param in required_slurm if param not in slurm_config]
+        missing_common = missing_required(REQUIRED_COMMON, common_params)
+        missing_slurm = missing_required(REQUIRED_SLURM, slurm_config)
         
         errors = []
         if missing_common:
@@ -126,34 +270,46 @@ class ConfigParser:
             
         if errors:
             raise ValueError(". ".join(errors))
+        self._validated = True
     
     def get_all_sections(self) -> list:
         """Get list of all sections in the .def file"""
-        return list(self.config.sections())
+        return list(self._snapshot)
     
-    def print_config_summary(self) -> None:
-        """Print a summary of the parsed configuration"""
-        print(f"Configuration file: {self.def_file_path}")
-        print(f"Sections found: {self.get_all_sections()}")
-        print("\n[common] parameters:")
-        for key, value in self.get_common_params().items():
-            print(f"  {key} = {value}")
-        print("\n[slurm] configuration:")
-        for key, value in self.get_slurm_config().items():
-            print(f"  {key} = {value}")
+    def format_config_summary(self) -> str:
+        """Format a summary of the parsed configuration"""
+        lines = [
+            f"Configuration file: {self.def_file_path}",
+            f"Sections found: {self.get_all_sections()}",
+            "\n[common] parameters:",
+        ]
+        lines.extend(f"  {key} = {value}" for key, value in self._snapshot['common'].items())
+        lines.append("\n[slurm] configuration:")
+        lines.extend(f"  {key} = {value}" for key, value in self._snapshot['slurm'].items())
+        lines.append("")
+        return "\n".join(lines)
     
-    def print_all_sections(self) -> None:
-        """Print all sections in a formatted way for debugging"""
-        print(f"=== Configuration file: {self.def_file_path} ===")
-        print(f"Sections found: {self.get_all_sections()}\n")
+    def format_all_sections(self) -> str:
+        """Format all sections for debugging"""
+        lines = [
+            f"=== Configuration file: {self.def_file_path} ===",
+            f"Sections found: {self.get_all_sections()}\n",
+        ]
         
-        for section_name in self.config.sections():
-            print(f"[{section_name}]")
-            section_params = dict(self.config[section_name])
+        for section_name, section_params in self._snapshot.items():
+            lines.append(f"[{section_name}]")
             if section_params:
-                for key, value in section_params.items():
-                    print(f"  {key} = {value}")
+                lines.extend(f"  {key} = {value}" for key, value in section_params.items())
             else:
-                print("  (empty section)")
-            print()  # blank line between sections
-
+                lines.append("  (empty section)")
+            lines.append("")  # blank line between sections
+        lines.append("")
+        return "\n".join(lines)
+    
+    def print_config_summary(self, file: Optional[TextIO] = None) -> None:
+        """Print a summary of the parsed configuration to file (default stdout)"""
+        (file or sys.stdout).write(self.format_config_summary())
+    
+    def print_all_sections(self, file: Optional[TextIO] = None) -> None:
+        """Print all sections to file (default stdout) for debugging"""
+        (file or sys.stdout).write(self.format_all_sections())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+src/slurm_pipeline/core/fast_config_parser.py
+
+Lightweight parser for .def files
+Handles the plain [section] / key = value subset of INI syntax that .def
+files use, without configparser's interpolation and proxy machinery
+"""
+
+import configparser
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# One alternative per line kind, scanned over the whole text in one pass.
+# [^\S\n] is horizontal whitespace (including a stray \r). Whether a line
+# continues the previous value depends on its indent, so that is decided in
+# read_string; content is the stripped line, None for blanks and comments
+_LINE_RE = re.compile(
+    r"""
+    ^(?P<indent>[^\S\n]*)
+    (?:
+        (?P<comment>[#;].*)?                               # blank or comment
+      | (?P<content>
+            \[(?P<section>.+)\].*                          # [section]
+          | (?P<key>[^=:\s][^=:\n]*?)[^\S\n]*[=:][^\S\n]*(?P<value>.*?)
+          | .+?                                           # anything else
+        )
+    )[^\S\n]*$
+    """,
+    re.MULTILINE | re.VERBOSE,
+)
+
+
+class FastConfigParser:
+    """
+    Minimal stand-in for configparser.RawConfigParser(interpolation=None)
+
+    Matches the stdlib parse of the .def format: option names are
+    lower-cased, full-line '#'/';' comments are skipped, inline '#' is kept
+    as part of the value, and a line indented deeper than its key continues
+    that key's value, keeping any blank lines inside it. [DEFAULT] options are inherited by
+    every section, and a section or option repeated within one read raises
+    DuplicateSectionError / DuplicateOptionError.
+
+    Differences from the stdlib: malformed lines and options before any
+    section header raise ValueError rather than configparser.ParsingError
+    or MissingSectionHeaderError, and there is no write support or
+    per-option get API, only sections() and [section] lookups.
+    """
+
+    def __init__(self) -> None:
+        self._sections: Dict[str, Dict[str, str]] = {}
+        self._defaults: Dict[str, str] = {}
+
+    def read(self, filename: Union[str, Path]) -> None:
+        """Parse a .def file from disk"""
+        self.read_string(Path(filename).read_text(), str(filename))
+
+    def read_string(self, text: str, source: str = "<string>") -> None:
+        """Parse .def content held in memory"""
+        section: Optional[Dict[str, str]] = None
+        section_name = ""
+        last_key: Optional[str] = None
+        # Indent of the last key or header line; only deeper lines continue
+        key_indent = 0
+        # Blank lines seen since last_key's value last grew; they only
+        # become part of the value if a continuation line follows
+        pending_blanks = 0
+        # Sections and (section, option) pairs seen in this read
+        seen_sections: Set[str] = set()
+        seen_options: Set[Tuple[str, str]] = set()
+
+        for match in _LINE_RE.finditer(text):
+            content = match.group("content")
+            if content is None:
+                # Blank line or comment; only blank lines count toward a value
+                if last_key is not None and match.group("comment") is None:
+                    pending_blanks += 1
+                continue
+
+            indent = match.end("indent") - match.start("indent")
+            if section is not None and last_key is not None and indent > key_indent:
+                newlines = "\n" * (pending_blanks + 1)
+                section[last_key] = f"{section[last_key]}{newlines}{content}"
+                pending_blanks = 0
+                continue
+            key_indent = indent
+
+            name = match.group("section")
+            if name is not None:
+                if name == configparser.DEFAULTSECT:
+                    section = self._defaults
+                else:
+                    if name in seen_sections:
+                        raise configparser.DuplicateSectionError(
+                            name, source, _lineno(text, match)
+                        )
+                    seen_sections.add(name)
+                    section = self._sections.setdefault(name, {})
+                section_name = name
+                last_key = None
+                continue
+
+            key = match.group("key")
+            if key is None:
+                raise ValueError(
+                    f"Invalid line {_lineno(text, match)} in {source}: "
+                    f"{match.group(0)!r}"
+                )
+
+            if section is None:
+                raise ValueError(
+                    f"Option before any section header at line "
+                    f"{_lineno(text, match)} in {source}"
+                )
+
+            last_key = key.lower()
+            if (section_name, last_key) in seen_options:
+                raise configparser.DuplicateOptionError(
+                    section_name, last_key, source, _lineno(text, match)
+                )
+            seen_options.add((section_name, last_key))
+            section[last_key] = match.group("value")
+            pending_blanks = 0
+
+    def has_section(self, section: str) -> bool:
+        """Check whether a section was parsed ([DEFAULT] never counts)"""
+        return section in self._sections
+
+    def sections(self) -> List[str]:
+        """Get section names in file order, without [DEFAULT]"""
+        return list(self._sections)
+
+    def defaults(self) -> Dict[str, str]:
+        """Get the options of the [DEFAULT] section"""
+        return self._defaults
+
+    def __getitem__(self, section: str) -> Dict[str, str]:
+        """Get the options of a section, including inherited defaults"""
+        if section == configparser.DEFAULTSECT:
+            return self._defaults
+        options = self._sections[section]
+        if not self._defaults:
+            return options
+        merged = dict(options)
+        for key, value in self._defaults.items():
+            merged.setdefault(key, value)
+        return merged
+
+
+def _lineno(text: str, match: "re.Match[str]") -> int:
+    """1-based line number of a match, counted only when an error needs it"""
+    return text.count("\n", 0, match.start()) + 1
@@ -27,6 +27,9 @@ class GPUJob(BaseJob):
         if "gpu_type" not in self.slurm_config:
             raise ValueError("GPU job requires 'gpu_type' in SLURM configuration")
 
+        # GPU type is fixed for the job's lifetime; resolve its resources once
+        self._gpu_resources = self.resource_config.get_gpu_resources()
+
     def get_gpu_job_config(
         self, job_name: str, memory_key: str, walltime_key: Optional[str] = None
     ) -> Dict[str, str]:
@@ -34,7 +37,7 @@ class GPUJob(BaseJob):
         job_config = self.get_base_job_config(job_name, memory_key, walltime_key)
 
         # Add GPU resources
-        gpu_resources = self.resource_config.get_gpu_resources()
+        gpu_resources = self._gpu_resources
         if gpu_resources:
             job_config["constraint"] = gpu_resources["constraint"]
             job_config["gres"] = f"gpu:{self.gpu_count}"
@@ -65,7 +68,7 @@ class GPUJob(BaseJob):
             job_config["dependency"] = f"afterok:{dependency}"
 
         # Build command
-        command = self.command_builder.build_command(mode, command_args)
+        command = self.command_builder.build_command_str(mode, command_args)
 
         # Generate script
         script_content = self.script_generator.generate_script(
@@ -31,6 +31,9 @@ class GPUArrayJob(ArrayJob, GPUJob):
         if "gpu_type" not in self.slurm_config:
             raise ValueError("GPU array job requires 'gpu_type' in SLURM configuration")
 
+        # GPU type is fixed for the job's lifetime; resolve its resources once
+        self._gpu_resources = self.resource_config.get_gpu_resources()
+
     def generate_gpu_array_job(
         self,
         job_name: str,
@@ -42,7 +45,13 @@ class GPUArrayJob(ArrayJob, GPUJob):
         walltime_key: Optional[str] = None,
         environment_setup: str = "",
     ) -> Dict[str, Any]:
-        """Generate a GPU array SLURM job"""
+        """
+        Generate a GPU array SLURM job
+
+        command_args reach the script unquoted, so values such as
+        {"procid": "$SLURM_ARRAY_TASK_ID"} expand per task; see
+        CommandBuilder.build_command_str.
+        """
 
         # Get GPU-specific job configuration
         job_config = self.get_gpu_job_config(job_name, memory_key, walltime_key)
@@ -51,16 +60,16 @@ class GPUArrayJob(ArrayJob, GPUJob):
         output_log, error_log = self.file_manager.get_log_paths(
             job_name, array_job=True
         )
-        job_config.update(
-            {"output": output_log, "error": error_log, "array_range": array_range}
-        )
+        job_config["output"] = output_log
+        job_config["error"] = error_log
+        job_config["array_range"] = array_range
 
         # Add dependency if specified
         if dependency:
             job_config["dependency"] = f"afterok:{dependency}"
 
         # Build command
-        command = self.command_builder.build_command(mode, command_args)
+        command = self.command_builder.build_command_str(mode, command_args)
 
         # Generate script
         script_content = self.script_generator.generate_script(
@@ -6,11 +6,19 @@ Pipeline orchestration and job management
 Coordinates multiple applications and manages job dependencies
 """
 
+import shlex
 import subprocess
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import CycleError, TopologicalSorter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from .config_parser import ConfigParser
 
+# Upper bound on concurrent sbatch calls, to avoid flooding slurmctld
+_MAX_SUBMIT_WORKERS = 16
+
 
 class PipelineDriver:
     """
@@ -18,56 +26,96 @@ class PipelineDriver:
     Manages multiple applications and their job dependencies
     """
 
-    def __init__(self, config_parser: ConfigParser, working_dir: str = ".") -> None:
+    def __init__(
+        self,
+        config_parser: ConfigParser,
+        working_dir: str = ".",
+        max_submit_workers: int = _MAX_SUBMIT_WORKERS,
+    ) -> None:
         """
         Initialize pipeline driver
 
         Args:
             config_parser: ConfigParser instance with pipeline configuration
             working_dir: Working directory for pipeline execution
+            max_submit_workers: Maximum number of concurrent sbatch calls
+                within one dependency wave
         """
         self.config = config_parser
-        self.working_dir = Path(working_dir).resolve()
-        self.working_dir.mkdir(parents=True, exist_ok=True)
+        self.max_submit_workers = max_submit_workers
+        # absolute() needs no symlink walk, unlike resolve(); an existing
+        # directory costs a single failed mkdir
+        self.working_dir = Path(working_dir).absolute()
+        try:
+            self.working_dir.mkdir(parents=True)
+        except FileExistsError:
+            if not self.working_dir.is_dir():
+                raise
 
         # Job registry
         self.applications: Dict[str, Any] = {}  # name -> job_instance
         self.job_scripts: Dict[str, Dict[str, Any]] = {}  # job_name -> script_info
-        self.job_dependencies: Dict[str, List[str]] = {}  # job_name -> [dependencies]
+        # job_name -> [dependencies]
+        self.job_dependencies: Dict[str, List[str]] = defaultdict(list)
+        self._jobs_by_app: Dict[str, List[str]] = {}  # app_name -> [job_names]
+        self._app_deps: Dict[str, List[str]] = {}  # app_name -> [parent app_names]
 
         # Execution state
         self.submitted_jobs: Dict[str, str] = {}  # job_name -> slurm_job_id
 
-    def add_application(self, name: str, job_instance: Any) -> None:
+    def add_application(
+        self, name: str, job_instance: Any, depends_on: Optional[List[str]] = None
+    ) -> None:
         """
         Add an application job to the pipeline
 
         Args:
             name: Name for this application (e.g., 'coyote', 'roadrunner')
             job_instance: Instance of job class (CoyoteJob, RoadrunnerJob, etc.)
+            depends_on: Names of applications that must finish before this
+                one starts (e.g. ['coyote'] for roadrunner)
         """
         self.applications[name] = job_instance
+        if depends_on:
+            self._app_deps[name] = list(depends_on)
 
     def generate_all_scripts(
-        self, dry_run: bool = True
+        self, dry_run: bool = True, parallel: bool = False
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Generate SLURM scripts for all applications
 
         Args:
             dry_run: If True, only generate scripts without dependencies resolution
+            parallel: If True, run the applications' generate_jobs() concurrently
+                in a thread pool. Only safe when they write to disjoint files;
+                applications sharing a working directory (e.g. its
+                common_params.json) must be generated serially, the default
 
         Returns:
             Dictionary mapping application names to their generated job info
         """
         all_generated_jobs = {}
 
-        for app_name, job_instance in self.applications.items():
-            print(f"Generating scripts for {app_name}...")
-
-            # Generate jobs for this application
-            jobs = job_instance.generate_jobs()
+        # Results come back in registration order either way
+        if parallel and len(self.applications) > 1:
+            for app_name in self.applications:
+                print(f"Generating scripts for {app_name}...")
+            instances = list(self.applications.values())
+            with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+                app_jobs = list(
+                    executor.map(lambda app: app.generate_jobs(), instances)
+                )
+        else:
+            app_jobs = []
+            for app_name, job_instance in self.applications.items():
+                print(f"Generating scripts for {app_name}...")
+                app_jobs.append(job_instance.generate_jobs())
+
+        # Registration stays on this thread, so the registries need no locking
+        for app_name, jobs in zip(self.applications, app_jobs):
             all_generated_jobs[app_name] = jobs
+            self._jobs_by_app[app_name] = [job["job_name"] for job in jobs]
 
             # Register jobs and their dependencies
             for job in jobs:
@@ -76,10 +124,7 @@ class PipelineDriver:
 
                 # Track dependencies within this application
                 if "depends_on_job" in job:
-                    dep_job_name = job["depends_on_job"]
-                    if job_name not in self.job_dependencies:
-                        self.job_dependencies[job_name] = []
-                    self.job_dependencies[job_name].append(dep_job_name)
+                    self.job_dependencies[job_name].append(job["depends_on_job"])
 
         if not dry_run:
             self._resolve_cross_application_dependencies()
@@ -87,46 +132,72 @@ class PipelineDriver:
         return all_generated_jobs
 
     def _resolve_cross_application_dependencies(self) -> None:
-        """Resolve dependencies between different applications"""
-        # This would implement logic for cross-application dependencies
-        # For example: roadrunner depends on coyote fillcf completion
-
-        # Example logic (to be customized based on pipeline requirements):
-        common_params = self.config.get_common_params()
-        basename = common_params.get("basename", "pipeline")
-
-        # If we have both coyote and roadrunner, roadrunner should depend on coyote fillcf
-        coyote_fillcf_job = f"{basename}_coyote_fillcf"
-        roadrunner_jobs = [
-            name for name in self.job_scripts.keys() if "roadrunner" in name
-        ]
+        """
+        Resolve dependencies between different applications
 
-        for roadrunner_job in roadrunner_jobs:
-            if coyote_fillcf_job in self.job_scripts:
-                if roadrunner_job not in self.job_dependencies:
-                    self.job_dependencies[roadrunner_job] = []
-                self.job_dependencies[roadrunner_job].append(coyote_fillcf_job)
+        Every entry job of a dependent application (one with no dependency
+        inside its own application) waits on every terminal job of each
+        parent application (one no other job in that application waits on).
 
-    def print_pipeline_summary(self) -> None:
-        """Print summary of the pipeline configuration"""
-        print("=== Pipeline Summary ===")
-        print(f"Working directory: {self.working_dir}")
-        print(f"Applications: {len(self.applications)}")
+        Raises:
+            ValueError: If an application depends on one that was never added
+        """
+        for app_name, parent_apps in self._app_deps.items():
+            entry_jobs = self._get_entry_jobs(app_name)
+            for parent_app in parent_apps:
+                if parent_app not in self._jobs_by_app:
+                    raise ValueError(
+                        f"Application '{app_name}' depends on unknown "
+                        f"application '{parent_app}'"
+                    )
+                terminal_jobs = self._get_terminal_jobs(parent_app)
+                for job_name in entry_jobs:
+                    self.job_dependencies[job_name].extend(terminal_jobs)
+
+    def _get_entry_jobs(self, app_name: str) -> List[str]:
+        """Jobs of an application that do not depend on its other jobs"""
+        return [
+            job_name
+            for job_name in self._jobs_by_app.get(app_name, ())
+            if "depends_on_job" not in self.job_scripts[job_name]
+        ]
 
-        for app_name in self.applications.keys():
-            print(f"  - {app_name}")
+    def _get_terminal_jobs(self, app_name: str) -> List[str]:
+        """Jobs of an application that none of its other jobs depend on"""
+        job_names = self._jobs_by_app.get(app_name, ())
+        depended_on = {
+            self.job_scripts[job_name].get("depends_on_job") for job_name in job_names
+        }
+        return [job_name for job_name in job_names if job_name not in depended_on]
+
+    def format_pipeline_summary(self) -> str:
+        """Format a summary of the pipeline configuration"""
+        lines = [
+            "=== Pipeline Summary ===",
+            f"Working directory: {self.working_dir}",
+            f"Applications: {len(self.applications)}",
+        ]
+        lines.extend(f"  - {app_name}" for app_name in self.applications)
 
-        print(f"\nGenerated jobs: {len(self.job_scripts)}")
+        lines.append(f"\nGenerated jobs: {len(self.job_scripts)}")
         for job_name, job_info in self.job_scripts.items():
             job_type = job_info.get("type", "unknown")
             phase = job_info.get("phase", "")
-            deps = self.job_dependencies.get(job_name, [])
+            # .get() so reading never inserts into the defaultdict
+            deps = self.job_dependencies.get(job_name)
 
-            print(f"  - {job_name} ({job_type})")
+            lines.append(f"  - {job_name} ({job_type})")
             if phase:
-                print(f"    Phase: {phase}")
+                lines.append(f"    Phase: {phase}")
             if deps:
-                print(f"    Depends on: {', '.join(deps)}")
+                lines.append(f"    Depends on: {', '.join(deps)}")
+
+        lines.append("")
+        return "\n".join(lines)
+
+    def print_pipeline_summary(self) -> None:
+        """Print summary of the pipeline configuration"""
+        sys.stdout.write(self.format_pipeline_summary())
 
     def validate_pipeline(self) -> Tuple[bool, List[str]]:
         """
@@ -135,6 +206,10 @@ class PipelineDriver:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        return self._validate_pipeline(self._build_dependency_graph())
+
+    def _validate_pipeline(self, graph: Dict[str, List[str]]) -> Tuple[bool, List[str]]:
+        """Validate the pipeline against an already-built dependency graph"""
         errors = []
 
         # Check that all applications have valid configurations
@@ -145,38 +220,38 @@ class PipelineDriver:
                 errors.append(f"{app_name}: {str(e)}")
 
         # Check for circular dependencies
-        visited = set()
-        rec_stack = set()
+        try:
+            TopologicalSorter(graph).prepare()
+        except CycleError as e:
+            cycle = " -> ".join(e.args[1])
+            errors.append(f"Circular dependency detected involving jobs: {cycle}")
 
-        def has_cycle(job_name: str) -> bool:
-            if job_name in rec_stack:
-                return True
-            if job_name in visited:
-                return False
-
-            visited.add(job_name)
-            rec_stack.add(job_name)
-
-            for dep in self.job_dependencies.get(job_name, []):
-                if has_cycle(dep):
-                    return True
-
-            rec_stack.remove(job_name)
-            return False
+        return len(errors) == 0, errors
 
-        for job_name in self.job_scripts.keys():
-            if has_cycle(job_name):
-                errors.append(f"Circular dependency detected involving job: {job_name}")
-                break
+    def _build_dependency_graph(self) -> Dict[str, List[str]]:
+        """
+        Map every registered job to its dependencies that are registered too
 
-        return len(errors) == 0, errors
+        Built once per validation or submission, so the graph algorithms and
+        the --dependency flags never re-filter dependencies themselves.
+        """
+        job_scripts = self.job_scripts
+        return {
+            job_name: [
+                dep
+                for dep in self.job_dependencies.get(job_name, ())
+                if dep in job_scripts
+            ]
+            for job_name in job_scripts
+        }
 
     def submit_pipeline(self, dry_run: bool = False) -> Dict[str, str]:
         """
         Submit all pipeline jobs to SLURM with proper dependencies
 
         Args:
-            dry_run: If True, use --test-only flag for sbatch
+            dry_run: If True, print the sbatch commands and assign DRY_RUN_<job>
+                placeholder IDs without calling sbatch
 
         Returns:
             Dictionary mapping job names to SLURM job IDs
@@ -185,98 +260,136 @@ class PipelineDriver:
             raise RuntimeError("No jobs generated. Call generate_all_scripts() first.")
 
         # Validate pipeline before submission
-        is_valid, errors = self.validate_pipeline()
+        graph = self._build_dependency_graph()
+        is_valid, errors = self._validate_pipeline(graph)
         if not is_valid:
             raise RuntimeError(f"Pipeline validation failed: {'; '.join(errors)}")
 
         submitted_jobs: Dict[str, str] = {}
 
-        # Submit jobs in dependency order
-        submission_order = self._get_submission_order()
-
-        for job_name in submission_order:
-            job_info = self.job_scripts[job_name]
-            script_path = job_info["script_path"]
+        # Submit jobs wave by wave; every job in a wave only depends on jobs
+        # from earlier waves, so a wave's sbatch calls can run concurrently
+        for wave in self._get_submission_waves(graph):
+            commands = []
+            for job_name in wave:
+                script_path = self.job_scripts[job_name]["script_path"]
+
+                # Dependencies were all submitted in earlier waves
+                resolved_deps = [submitted_jobs[dep] for dep in graph[job_name]]
+
+                if resolved_deps:
+                    dep_string = ":".join(resolved_deps)
+                    sbatch_cmd = [
+                        "sbatch",
+                        "--dependency",
+                        f"afterok:{dep_string}",
+                        script_path,
+                    ]
+                else:
+                    sbatch_cmd = ["sbatch", script_path]
 
-            # Build sbatch command
-            sbatch_cmd = ["sbatch"]
+                print(f"Submitting {job_name}...")
+                if dry_run:
+                    # Nothing is run; report the command with a placeholder ID
+                    print(f"  Command: {shlex.join(sbatch_cmd)}")
+                    submitted_jobs[job_name] = f"DRY_RUN_{job_name}"
+                else:
+                    commands.append(sbatch_cmd)
 
             if dry_run:
-                sbatch_cmd.append("--test-only")
+                continue
 
-            # Add dependencies if needed
-            deps = self.job_dependencies.get(job_name, [])
-            resolved_deps = []
-            for dep in deps:
-                if dep in submitted_jobs:
-                    resolved_deps.append(submitted_jobs[dep])
+            results = self._submit_wave(wave, commands)
+            for job_name, result in zip(wave, results):
+                if isinstance(result, str):
+                    submitted_jobs[job_name] = result
+                    print(f"  {job_name} Job ID: {result}")
 
-            if resolved_deps:
-                dep_string = ":".join(resolved_deps)
-                sbatch_cmd.extend(["--dependency", f"afterok:{dep_string}"])
+            failures = [result for result in results if isinstance(result, Exception)]
+            if failures:
+                # Keep every job that did get queued, including this wave's
+                # successful siblings, so it can still be found and cancelled
+                self.submitted_jobs.update(submitted_jobs)
+                raise failures[0]
 
-            sbatch_cmd.append(script_path)
+        self.submitted_jobs.update(submitted_jobs)
+        return submitted_jobs
 
-            # Submit job
-            print(f"Submitting {job_name}...")
-            if dry_run:
-                print(f"  Command: {' '.join(sbatch_cmd)}")
+    def _submit_wave(
+        self, wave: List[str], commands: List[List[str]]
+    ) -> List[Union[str, Exception]]:
+        """
+        Submit one wave, concurrently when it holds several jobs
 
-            try:
-                result = subprocess.run(
-                    sbatch_cmd, capture_output=True, text=True, check=True
-                )
+        Returns:
+            Each job's SLURM ID, or the exception its submission raised, in
+            wave order; one failure never hides the IDs of its siblings
+        """
 
-                if dry_run:
-                    # For dry run, we don't get a real job ID
-                    job_id = f"DRY_RUN_{job_name}"
-                else:
-                    # Parse job ID from sbatch output: "Submitted batch job 12345"
-                    output_line = result.stdout.strip()
-                    job_id = output_line.split()[-1]
+        def submit(job_name: str, sbatch_cmd: List[str]) -> Union[str, Exception]:
+            try:
+                return self._submit_job(job_name, sbatch_cmd)
+            except Exception as e:
+                return e
 
-                submitted_jobs[job_name] = job_id
-                print(f"  Job ID: {job_id}")
+        if len(wave) == 1:
+            return [submit(wave[0], commands[0])]
 
-            except subprocess.CalledProcessError as e:
-                error_msg = f"Failed to submit {job_name}: {e.stderr}"
-                print(f"  ERROR: {error_msg}")
-                raise RuntimeError(error_msg)
+        workers = min(len(wave), self.max_submit_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(submit, wave, commands))
 
-        self.submitted_jobs.update(submitted_jobs)
-        return submitted_jobs
+    def _submit_job(self, job_name: str, sbatch_cmd: List[str]) -> str:
+        """
+        Run one sbatch command and return the SLURM job ID
 
-    def _get_submission_order(self) -> List[str]:
-        """Get job submission order respecting dependencies"""
-        # Topological sort of jobs based on dependencies
-        in_degree = {}
+        Raises:
+            RuntimeError: If sbatch fails
+        """
+        try:
+            result = subprocess.run(
+                sbatch_cmd, capture_output=True, text=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            error_msg = f"Failed to submit {job_name}: {e.stderr}"
+            print(f"  ERROR: {error_msg}")
+            raise RuntimeError(error_msg)
+
+        # Parse job ID from sbatch output: "Submitted batch job 12345"
+        return result.stdout.strip().split()[-1]
+
+    def _get_submission_waves(
+        self, graph: Optional[Dict[str, List[str]]] = None
+    ) -> List[List[str]]:
+        """
+        Group jobs into dependency waves
 
-        # Initialize in-degree count
-        for job_name in self.job_scripts.keys():
-            in_degree[job_name] = 0
+        Each wave holds every job whose dependencies were all released by
+        earlier waves (graphlib's ready set, taken round by round).
 
-        # Count incoming edges (dependencies)
-        for job_name, deps in self.job_dependencies.items():
-            for dep in deps:
-                if dep in in_degree:  # Only count dependencies that exist
-                    in_degree[job_name] += 1
+        Args:
+            graph: Dependency graph from _build_dependency_graph(); built
+                here when not given
 
-        # Queue of jobs with no dependencies
-        queue = [job for job, degree in in_degree.items() if degree == 0]
-        submission_order = []
+        Raises:
+            graphlib.CycleError: If the dependencies contain a cycle
+        """
+        if graph is None:
+            graph = self._build_dependency_graph()
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
 
-        while queue:
-            current_job = queue.pop(0)
-            submission_order.append(current_job)
+        waves = []
+        while sorter.is_active():
+            wave = list(sorter.get_ready())
+            waves.append(wave)
+            sorter.done(*wave)
 
-            # Reduce in-degree for dependent jobs
-            for job_name, deps in self.job_dependencies.items():
-                if current_job in deps:
-                    in_degree[job_name] -= 1
-                    if in_degree[job_name] == 0:
-                        queue.append(job_name)
+        return waves
 
-        return submission_order
+    def _get_submission_order(self) -> List[str]:
+        """Get job submission order respecting dependencies"""
+        return [job for wave in self._get_submission_waves() for job in wave]
 
     def get_job_status(self) -> Dict[str, str]:
         """
@@ -288,29 +401,36 @@ class PipelineDriver:
         if not self.submitted_jobs:
             return {}
 
-        job_status = {}
+        job_ids = [
+            job_id
+            for job_id in self.submitted_jobs.values()
+            if not job_id.startswith("DRY_RUN")
+        ]
 
+        # One squeue call for every job; array tasks report as <id>_<task>,
+        # and the first state listed for a job is kept
+        queue_states: Dict[str, str] = {}
+        query_failed = False
+        if job_ids:
+            result = subprocess.run(
+                ["squeue", "-j", ",".join(job_ids), "-h", "-o", "%i %T"],
+                capture_output=True,
+                text=True,
+            )
+            for line in result.stdout.splitlines():
+                fields = line.split()
+                if len(fields) == 2:
+                    queue_states.setdefault(fields[0].split("_", 1)[0], fields[1])
+            query_failed = result.returncode != 0 and not queue_states
+
+        job_status = {}
         for job_name, job_id in self.submitted_jobs.items():
             if job_id.startswith("DRY_RUN"):
                 job_status[job_name] = "DRY_RUN"
-                continue
-
-            try:
-                # Query job status
-                result = subprocess.run(
-                    ["squeue", "-j", job_id, "-h", "-o", "%T"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                if result.stdout.strip():
-                    job_status[job_name] = result.stdout.strip()
-                else:
-                    # Job not found in queue, might be completed
-                    job_status[job_name] = "COMPLETED"
-
-            except subprocess.CalledProcessError:
+            elif query_failed:
                 job_status[job_name] = "UNKNOWN"
+            else:
+                # Job not found in queue, might be completed
+                job_status[job_name] = queue_states.get(job_id, "COMPLETED")
 
         return job_status
@@ -39,7 +39,7 @@ class SingleJob(BaseJob):
             job_config["dependency"] = f"afterok:{dependency}"
 
         # Build command
-        command = self.command_builder.build_command(mode, command_args)
+        command = self.command_builder.build_command_str(mode, command_args)
 
         # Generate script
         script_content = self.script_generator.generate_script(
@@ -13,11 +13,29 @@ Usage:
 import argparse
 import json
 import os
-import subprocess
+import stat
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:  # optional speedup, see the "fast" extra
+    _HAVE_ORJSON = False
+
+# Common parameters that are pipeline settings rather than coyote arguments
+_NON_COYOTE_PARAMS = frozenset({"basename", "iterations"})
+
+
+def _stat_mode(path: Path) -> Optional[int]:
+    """Return st_mode for path with a single stat call, or None if missing"""
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 
 class CoyoteWorker:
     """Worker class for executing coyote commands"""
@@ -46,13 +64,27 @@ class CoyoteWorker:
         
         # Validate inputs
         self.validate_setup()
+
+        # Arguments shared by every mode are fixed for the worker's lifetime
+        self._base_argv = (
+            str(self.coyote_app),
+            "help=noprompt",
+            *(
+                f"{key}={value}"
+                for key, value in self.common_params.items()
+                if key not in _NON_COYOTE_PARAMS
+            ),
+            *(f"{key}={value}" for key, value in self.app_params.items()),
+            f"cfcache={self.cfcache_dir}",
+        )
     
     def validate_setup(self) -> None:
         """Validate worker setup"""
-        if not self.coyote_app.exists():
+        mode = _stat_mode(self.coyote_app)
+        if mode is None:
             raise FileNotFoundError(f"Coyote executable not found: {self.coyote_app}")
         
-        if not self.coyote_app.is_file():
+        if not stat.S_ISREG(mode):
             raise ValueError(f"Coyote path is not a file: {self.coyote_app}")
         
         if self.nprocs <= 0:
@@ -65,12 +97,14 @@ class CoyoteWorker:
         """Validate data directory and VLA surface file"""
         # Check if data directory exists in current working directory
         data_dir = Path.cwd() / "data"
-        if not data_dir.exists():
+        mode = _stat_mode(data_dir)
+        if mode is None or not stat.S_ISDIR(mode):
             raise FileNotFoundError(f"Data directory not found: {data_dir}")
         
         # Check for VLA surface file
         vla_surface = data_dir / "nrao" / "VLA" / "VLA.surface"
-        if not vla_surface.exists():
+        mode = _stat_mode(vla_surface)
+        if mode is None or not stat.S_ISREG(mode):
             raise FileNotFoundError(f"VLA surface file not found: {vla_surface}")
         
         print(f"Data environment validated: {data_dir}")
@@ -100,19 +134,8 @@ class CoyoteWorker:
         Returns:
             Command as list of strings
         """
-        cmd = [str(self.coyote_app), "help=noprompt"]
-        
-        # Add common parameters
-        for key, value in self.common_params.items():
-            if key not in ["basename", "iterations"]:  # Skip non-coyote params
-                cmd.append(f"{key}={value}")
-        
-        # Add app-specific parameters
-        for key, value in self.app_params.items():
-            cmd.append(f"{key}={value}")
-        
-        # Add cfcache parameter
-        cmd.append(f"cfcache={self.cfcache_dir}")
+        # Executable, common and app parameters, and cfcache
+        cmd = list(self._base_argv)
         
         # Add mode-specific parameters
         if mode == "dryrun":
@@ -138,7 +161,8 @@ class CoyoteWorker:
         Execute coyote in dryrun mode
         
         Returns:
-            Exit code
+            Exit code; only returns on failure, since on success the worker
+            process is replaced by coyote
         """
         print(f"Running coyote dryrun mode")
         print(f"CF cache directory: {self.cfcache_dir}")
@@ -155,23 +179,15 @@ class CoyoteWorker:
         
         print(f"Executing: {' '.join(cmd)}")
         
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=False)
-            print("Dryrun completed successfully")
-            return result.returncode
-        except subprocess.CalledProcessError as e:
-            print(f"Dryrun failed with exit code {e.returncode}")
-            return e.returncode
-        except Exception as e:
-            print(f"Dryrun failed with error: {e}")
-            return 1
+        return _exec_command(cmd, "Dryrun")
     
     def run_fillcf(self) -> int:
         """
         Execute coyote in fillcf mode
         
         Returns:
-            Exit code
+            Exit code; only returns on failure, since on success the worker
+            process is replaced by coyote
         """
         # Get process ID from SLURM array task ID
         process_id = os.environ.get('SLURM_ARRAY_TASK_ID')
@@ -201,23 +217,36 @@ class CoyoteWorker:
         
         print(f"Executing: {' '.join(cmd)}")
         
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=False)
-            print(f"Fillcf process {process_id} completed successfully")
-            return result.returncode
-        except subprocess.CalledProcessError as e:
-            print(f"Fillcf process {process_id} failed with exit code {e.returncode}")
-            return e.returncode
-        except Exception as e:
-            print(f"Fillcf process {process_id} failed with error: {e}")
-            return 1
+        return _exec_command(cmd, f"Fillcf process {process_id}")
+
+
+def _exec_command(cmd: List[str], label: str) -> int:
+    """
+    Replace the worker process with cmd
+
+    coyote inherits the worker's PID, environment and stdio, so its exit
+    code becomes the SLURM task's exit code directly and no idle Python
+    interpreter waits on it. Returns only if the exec itself fails.
+    """
+    # Pending output would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
+        print(f"{label} failed with error: {e}")
+    return 1
 
 
 def load_json_params(file_path: str) -> Dict[str, Any]:
     """Load parameters from JSON file"""
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        params: Dict[str, Any] = (
+            orjson.loads(data) if _HAVE_ORJSON else json.loads(data)
+        )
+        return params
     except Exception as e:
         print(f"Warning: Could not load parameters from {file_path}: {e}")
         return {}
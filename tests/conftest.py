@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 
 @pytest.fixture
@@ -15,7 +16,7 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_def_content():
     """Sample .def file content for tests"""
     return """[common]
@@ -60,15 +61,57 @@ oversampling = 20
 """
 
 
-@pytest.fixture
-def sample_def_file(temp_dir, sample_def_content):
-    """Create a sample .def file for tests"""
-    def_file = temp_dir / "test.def"
-    with open(def_file, "w") as f:
-        f.write(sample_def_content)
+@pytest.fixture(scope="session")
+def sample_def_file(tmp_path_factory, sample_def_content):
+    """
+    Create a sample .def file once for the whole session
+
+    Read-only: tests that need to edit a .def file write their own copy.
+    """
+    def_file = tmp_path_factory.mktemp("cfg") / "test.def"
+    def_file.write_text(sample_def_content)
     return def_file
 
 
+@pytest.fixture(scope="session")
+def dummy_coyote_binary(tmp_path_factory):
+    """Create an executable stand-in for the coyote binary once per session"""
+    coyote_binary = tmp_path_factory.mktemp("bin") / "coyote"
+    coyote_binary.write_text("#!/bin/bash\necho 'dummy coyote'")
+    coyote_binary.chmod(0o755)
+    return coyote_binary
+
+
+@pytest.fixture(scope="session")
+def shared_scripts_dir(tmp_path_factory):
+    """
+    Directory shared by every test that only reads job scripts
+
+    Tests that write state into their working directory use temp_dir.
+    """
+    return tmp_path_factory.mktemp("scripts")
+
+
+@pytest.fixture(scope="session")
+def script_factory(shared_scripts_dir):
+    """
+    Return a callable that hands out executable dummy job scripts by name
+
+    Each name is written once per session; later requests reuse the file.
+    """
+    scripts = {}
+
+    def make(name):
+        if name not in scripts:
+            script = shared_scripts_dir / name
+            script.write_text('#!/bin/bash\necho "mock script"')
+            script.chmod(0o755)
+            scripts[name] = script
+        return scripts[name]
+
+    return make
+
+
 @pytest.fixture
 def mock_data_dir(temp_dir):
     """Create a mock data directory with required VLA surface file for tests"""
@@ -81,3 +124,28 @@ def mock_data_dir(temp_dir):
     vla_surface.write_text("# Mock VLA surface file for testing\n")
     
     return str(data_dir)
+
+
+@pytest.fixture(scope="session")
+def parsed_config(sample_def_file):
+    """
+    ConfigParser for the sample .def file, parsed once per session
+
+    Safe to share: ConfigParser getters return read-only views.
+    """
+    from slurm_pipeline.core import ConfigParser
+
+    return ConfigParser(str(sample_def_file))
+
+
+@pytest.fixture
+def coyote_job(temp_dir, parsed_config, mock_data_dir, dummy_coyote_binary):
+    """CoyoteJob built from the sample .def file, staged against mock_data_dir"""
+    from slurm_pipeline.applications import CoyoteJob
+
+    # Mock the setup_data_directory to use our mock data directory
+    with patch(
+        "slurm_pipeline.core.components.file_manager.FileManager.setup_data_directory",
+        return_value=mock_data_dir,
+    ):
+        return CoyoteJob(parsed_config, str(temp_dir), str(dummy_coyote_binary))
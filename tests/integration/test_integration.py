@@ -8,12 +8,8 @@ import tempfile
 import json
 from pathlib import Path
 
-
-def test_complete_pipeline_integration(temp_dir):
-    """Test complete pipeline from .def file to SLURM scripts"""
-
-    # Create test .def file
-    def_content = """[common]
+# .def file for a small dryrun + fillcf pipeline
+_DEF_CONTENT = """[common]
 vis = integration_test.ms
 telescope = EVLA
 imsize = 1024
@@ -46,17 +42,8 @@ buffersize = 0
 oversampling = 20
 """
 
-    def_file = temp_dir / "integration_test.def"
-    with open(def_file, "w") as f:
-        f.write(def_content)
-
-    # Create dummy coyote binary
-    coyote_binary = temp_dir / "coyote"
-    coyote_binary.write_text("#!/bin/bash\necho 'dummy coyote for integration test'")
-    coyote_binary.chmod(0o755)
-
-    # Create dummy worker module
-    worker_content = """#!/usr/bin/env python3
+# Stand-in for the coyote worker module
+_WORKER_CONTENT = """#!/usr/bin/env python3
 import argparse
 import os
 import json
@@ -77,9 +64,14 @@ if __name__ == "__main__":
     main()
 """
 
+
+def test_complete_pipeline_integration(temp_dir, dummy_coyote_binary):
+    """Test complete pipeline from .def file to SLURM scripts"""
+    def_file = temp_dir / "integration_test.def"
+    def_file.write_text(_DEF_CONTENT)
+
     worker_file = temp_dir / "coyote_worker.py"
-    with open(worker_file, "w") as f:
-        f.write(worker_content)
+    worker_file.write_text(_WORKER_CONTENT)
     worker_file.chmod(0o755)
 
     # Test the pipeline (would use real classes in practice)
@@ -90,12 +82,10 @@ if __name__ == "__main__":
     # from slurm_pipeline.applications import CoyoteJob
 
     # config = ConfigParser(str(def_file))
-    # coyote_job = CoyoteJob(config, str(output_dir), str(coyote_binary))
+    # coyote_job = CoyoteJob(config, str(output_dir), str(dummy_coyote_binary))
     # jobs = coyote_job.generate_jobs()
 
     # For now, just verify the structure is correct
     assert def_file.exists()
-    assert coyote_binary.exists()
+    assert dummy_coyote_binary.exists()
     assert worker_file.exists()
-
-    print("Integration test structure validated")
@@ -6,25 +6,35 @@ Unit tests for base job classes
 import pytest
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
+
+# Read-only config sections, mirroring what ConfigParser getters return
+_COMMON = MappingProxyType(
+    {"vis": "test.ms", "basename": "test_run", "telescope": "EVLA"}
+)
+_SLURM = MappingProxyType(
+    {
+        "account": "test_account",
+        "email": "test@msu.edu",
+        "gpu_type": "h200",
+        "default_walltime": "2:00:00",
+        "coyote_mem": "4GB",
+        "roadrunner_mem": "32GB",
+    }
+)
+_APP = MappingProxyType({"mode": "test", "param1": "value1"})
 
 
 # Mock config parser for testing
 class MockConfigParser:
     def get_common_params(self):
-        return {"vis": "test.ms", "basename": "test_run", "telescope": "EVLA"}
+        return _COMMON
 
     def get_slurm_config(self):
-        return {
-            "account": "test_account",
-            "email": "test@msu.edu",
-            "gpu_type": "h200",
-            "default_walltime": "2:00:00",
-            "coyote_mem": "4GB",
-            "roadrunner_mem": "32GB",
-        }
+        return _SLURM
 
     def get_app_params(self, app_name):
-        return {"mode": "test", "param1": "value1"}
+        return _APP
 
 
 # Test concrete implementations
@@ -55,6 +65,30 @@ class TestSingleJob:
         assert jobs[0]["job_name"] == "test_single"
         assert Path(jobs[0]["script_path"]).exists()
 
+    def test_validate_requirements_order(self, temp_dir):
+        """Test missing parameters are reported in their declared order"""
+        from slurm_pipeline.core import SingleJob
+
+        class ConcreteSingleJob(SingleJob):
+            def get_app_name(self):
+                return "test_app"
+
+            def setup_command_builder(self):
+                self.command_builder.set_executable("/usr/bin/test")
+
+            def generate_jobs(self):
+                return []
+
+        single_job = ConcreteSingleJob(MockConfigParser(), str(temp_dir))
+        single_job.common_params = {}
+        single_job.slurm_config = {}
+
+        with pytest.raises(ValueError) as exc_info:
+            single_job.validate_requirements()
+        assert str(exc_info.value) == (
+            "Missing required parameters: ['vis', 'basename', 'account', 'email']"
+        )
+
 
 class TestArrayJob:
     """Test ArrayJob implementation"""
@@ -83,6 +117,32 @@ class TestArrayJob:
         assert jobs[0]["array_range"] == "0-7"
         assert Path(jobs[0]["script_path"]).exists()
 
+    def test_array_job_task_id_arg(self, temp_dir):
+        """Test command_args reach the script unquoted for $VAR expansion"""
+        from slurm_pipeline.core import ArrayJob
+
+        class ConcreteArrayJob(ArrayJob):
+            def get_app_name(self):
+                return "test_app"
+
+            def setup_command_builder(self):
+                self.command_builder.set_executable("/usr/bin/test")
+
+            def generate_jobs(self):
+                return [
+                    self.generate_array_job(
+                        "test_array",
+                        "coyote_mem",
+                        "0-7",
+                        command_args={"procid": "$SLURM_ARRAY_TASK_ID"},
+                    )
+                ]
+
+        jobs = ConcreteArrayJob(MockConfigParser(), str(temp_dir)).generate_jobs()
+
+        script = Path(jobs[0]["script_path"]).read_text()
+        assert "/usr/bin/test procid=$SLURM_ARRAY_TASK_ID" in script
+
 
 class TestGPUJob:
     """Test GPUJob implementation"""
@@ -110,3 +170,8 @@ class TestGPUJob:
         assert jobs[0]["type"] == "gpu"
         assert jobs[0]["gpu_type"] == "h200"
         assert jobs[0]["gpu_count"] == 1
+
+        # gres follows gpu_count even when it changes after construction
+        gpu_job.gpu_count = 4
+        job_config = gpu_job.get_gpu_job_config("test_gpu", "roadrunner_mem")
+        assert job_config["gres"] == "gpu:4"
@@ -3,6 +3,10 @@
 Unit tests for composition classes
 """
 
+import errno
+import os
+import shutil
+
 import pytest
 import tempfile
 from pathlib import Path
@@ -13,6 +17,7 @@ from slurm_pipeline.core.components import (
     FileManager,
     ScriptGenerator,
 )
+from slurm_pipeline.core.components.file_manager import _copy_file, _copy_tree
 
 
 class TestCommandBuilder:
@@ -45,6 +50,39 @@ class TestCommandBuilder:
         # If you want to check for mode, you should add it as a base or mode arg
         assert "cfcache=/path/to/cache" in command
 
+        # Cached command picks up later argument changes
+        cmd_builder.add_mode_args("dryrun", wplanes="1")
+        assert "wplanes=1" in cmd_builder.build_command("dryrun")
+        cmd_builder.add_base_args(imsize="512")
+        assert "imsize=512" in cmd_builder.build_command("dryrun")
+
+    def test_command_str_quoting(self):
+        """Test shell-quoted command string building"""
+        cmd_builder = CommandBuilder()
+        cmd_builder.set_executable("/path/to/coyote")
+        cmd_builder.add_base_args(vis="test file.ms", spw="*")
+        cmd_builder.add_mode_args("dryrun", cfcache="/path/to/cache")
+
+        command_str = cmd_builder.build_command_str("dryrun")
+        assert command_str == (
+            "/path/to/coyote 'vis=test file.ms' 'spw=*' cfcache=/path/to/cache"
+        )
+
+        # Base prefix is rebuilt when base args change
+        cmd_builder.add_base_args(imsize="512")
+        assert "imsize=512" in cmd_builder.build_command_str()
+
+    def test_command_str_extra_args_unquoted(self):
+        """Test extra_args stay unquoted so the job's shell expands $VARs"""
+        cmd_builder = CommandBuilder()
+        cmd_builder.set_executable("/path/to/coyote")
+        cmd_builder.add_base_args(spw="*")
+
+        command_str = cmd_builder.build_command_str(
+            extra_args={"procid": "$SLURM_ARRAY_TASK_ID"}
+        )
+        assert command_str == "/path/to/coyote 'spw=*' procid=$SLURM_ARRAY_TASK_ID"
+
     def test_python_command(self):
         """Test Python command building"""
         cmd_builder = CommandBuilder()
@@ -116,6 +154,57 @@ class TestFileManager:
         assert "test_job_%A_%a.out" in output_log
         assert "test_job_%A_%a.err" in error_log
 
+    def test_copy_file(self, temp_dir):
+        """Test file copy with mode"""
+        source = temp_dir / "source.py"
+        source.write_bytes(b"print('worker')\n" * 1000)
+
+        target = _copy_file(str(source), str(temp_dir / "target.py"), 0o755)
+
+        assert Path(target).read_bytes() == source.read_bytes()
+        assert Path(target).stat().st_mode & 0o777 == 0o755
+
+    def test_copy_file_read_write_fallback(self, temp_dir, monkeypatch):
+        """Test copy falls back to read/write when sendfile is unavailable"""
+        source = temp_dir / "source.dat"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+
+        def no_sendfile(*args):
+            raise OSError(errno.EINVAL, "sendfile not supported")
+
+        monkeypatch.setattr(os, "sendfile", no_sendfile)
+        target = _copy_file(str(source), str(temp_dir / "target.dat"))
+
+        assert Path(target).read_bytes() == source.read_bytes()
+
+    def test_copy_file_same_file(self, temp_dir):
+        """Test copying a file onto itself raises and leaves it intact"""
+        source = temp_dir / "coyote_worker.py"
+        source.write_text("print('worker')\n")
+
+        with pytest.raises(shutil.SameFileError):
+            _copy_file(str(source), str(source), 0o755)
+        # Same file through a different path spelling
+        with pytest.raises(shutil.SameFileError):
+            _copy_file(str(source), str(temp_dir / "." / "coyote_worker.py"))
+
+        assert source.read_text() == "print('worker')\n"
+
+    def test_copy_tree(self, temp_dir):
+        """Test directory tree copy"""
+        source = temp_dir / "src"
+        (source / "nrao" / "VLA").mkdir(parents=True)
+        (source / "empty").mkdir()
+        (source / "top.txt").write_text("top")
+        (source / "nrao" / "VLA" / "VLA.surface").write_text("surface")
+
+        target = temp_dir / "dst"
+        _copy_tree(source, target)
+
+        assert (target / "top.txt").read_text() == "top"
+        assert (target / "nrao" / "VLA" / "VLA.surface").read_text() == "surface"
+        assert (target / "empty").is_dir()
+
 
 class TestScriptGenerator:
     """Test ScriptGenerator functionality"""
@@ -159,3 +248,6 @@ class TestScriptGenerator:
         assert "#!/bin/bash" in script
         assert "#SBATCH --job-name=test_job" in script
         assert "/path/to/coyote help=noprompt mode=dryrun" in script
+        assert f"#SBATCH --chdir={temp_dir}" in script
+        # Caller's job config is left untouched
+        assert "chdir" not in job_config
@@ -6,11 +6,29 @@ Unit tests for ConfigParser class
 """
 
 import pytest
+import configparser
 import tempfile
+import io
 import os
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from unittest.mock import patch
 
-from slurm_pipeline.core import ConfigParser
+from slurm_pipeline.core import ConfigParser, FastConfigParser
+
+# Keys every get_gpu_resources result carries
+_EXPECTED_GPU_KEYS = frozenset(
+    {"constraint", "cpu_mem_per_gpu", "gpu_mem", "default_gpu_walltime"}
+)
+
+# Expected error messages for pytest.raises(match=...)
+_RE_NOT_FOUND = re.compile("Definition file not found")
+_RE_MISSING_SECTIONS = re.compile("Missing required sections")
+_RE_MISSING_COMMON = re.compile("Missing required.*common.*parameters")
+_RE_MISSING_SLURM = re.compile("Missing required.*slurm.*parameters")
+_RE_BAD_GPU = re.compile("Unsupported GPU type 'invalid_gpu'")
+_RE_NO_SECTION = re.compile("before any section")
 
 
 class TestConfigParser:
@@ -25,42 +43,113 @@ class TestConfigParser:
 
     def test_initialization_file_not_found(self):
         """Test ConfigParser initialization with non-existent file"""
-        with pytest.raises(FileNotFoundError, match="Definition file not found"):
+        with pytest.raises(FileNotFoundError, match=_RE_NOT_FOUND):
             ConfigParser("/nonexistent/path/test.def")
 
-    def test_missing_required_sections(self, temp_dir):
+    def test_missing_required_sections(self):
         """Test ConfigParser with missing required sections"""
-        # Create .def file missing [slurm] section
+        # .def content missing [slurm] section
         incomplete_def = """[common]
 vis = test.ms
 basename = test_run
 """
 
-        def_file = temp_dir / "incomplete.def"
-        with open(def_file, "w") as f:
-            f.write(incomplete_def)
+        with pytest.raises(ValueError, match=_RE_MISSING_SECTIONS):
+            ConfigParser.from_text(incomplete_def)
+
+        # Every missing section is listed, in a fixed order
+        with pytest.raises(ValueError, match=re.escape("['common', 'slurm']")):
+            ConfigParser.from_text("[coyote]\nwplanes = 1\n")
+
+    def test_parse_cached_until_file_changes(self, temp_dir, sample_def_content):
+        """Test repeat parsers share one parse until the file is edited"""
+        def_file = temp_dir / "cached.def"
+        def_file.write_text(sample_def_content)
+
+        first = ConfigParser(str(def_file))
+        second = ConfigParser(str(def_file))
+        assert second.get_common_params() is first.get_common_params()
+
+        def_file.write_text(sample_def_content + "\n[extra]\nkey = value\n")
+        edited = ConfigParser(str(def_file))
+        assert edited.get_common_params() is not first.get_common_params()
+        assert edited.get_app_params("extra") == {"key": "value"}
+
+    def test_parse_cache_sees_same_size_same_mtime_edit(
+        self, temp_dir, sample_def_content
+    ):
+        """Test an edit that keeps size and mtime is still re-parsed"""
+        def_file = temp_dir / "coarse.def"
+        def_file.write_text(sample_def_content)
+        stat = def_file.stat()
+        first = ConfigParser(str(def_file))
+
+        # Same length, and the mtime put back, as on a coarse-timestamp NFS
+        def_file.write_text(sample_def_content.replace("test_run", "test_new"))
+        os.utime(def_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert def_file.stat().st_size == stat.st_size
+
+        edited = ConfigParser(str(def_file))
+        assert first.get_common_params()["basename"] == "test_run"
+        assert edited.get_common_params()["basename"] == "test_new"
+
+    def test_cached_parse_keeps_parsers_private(self, temp_dir, sample_def_content):
+        """Test editing one instance's parser does not leak into the cache"""
+        def_file = temp_dir / "private.def"
+        def_file.write_text(sample_def_content)
+
+        first = ConfigParser(str(def_file))
+        first.config["common"]["vis"] = "mutated.ms"
+
+        second = ConfigParser(str(def_file))
+        assert second.config is not first.config
+        assert second.config["common"]["vis"] == "test_sim.ms"
+        assert second.get_common_params()["vis"] == "test_sim.ms"
+
+    def test_large_def_file(self, temp_dir, sample_def_content):
+        """Test a .def file big enough to be memory-mapped parses normally"""
+        padding = "".join(f"key{i} = value{i}\n" for i in range(5000))
+        def_file = temp_dir / "large.def"
+        def_file.write_text(f"{sample_def_content}\n[padding]\n{padding}")
+        assert def_file.stat().st_size > 64 * 1024
+
+        parser = ConfigParser(str(def_file))
+        assert parser.get_common_params()["basename"] == "test_run"
+        assert parser.get_app_params("padding")["key4999"] == "value4999"
+
+    def test_from_text_matches_from_path(self, sample_def_file):
+        """Test in-memory .def content parses like the file on disk"""
+        from_path = ConfigParser.from_path(sample_def_file)
+        from_text = ConfigParser.from_text(
+            sample_def_file.read_text(), origin="template"
+        )
 
-        with pytest.raises(ValueError, match="Missing required sections"):
-            ConfigParser(str(def_file))
+        assert str(from_text.def_file_path) == "template"
+        assert from_text.get_all_sections() == from_path.get_all_sections()
+        assert from_text.get_common_params() == from_path.get_common_params()
 
     def test_get_common_params(self, sample_def_file):
         """Test getting common parameters"""
         parser = ConfigParser(str(sample_def_file))
         common_params = parser.get_common_params()
 
-        assert isinstance(common_params, dict)
+        assert isinstance(common_params, Mapping)
         assert "vis" in common_params
         assert "basename" in common_params
         assert "telescope" in common_params
         assert common_params["vis"] == "test_sim.ms"
         assert common_params["basename"] == "test_run"
 
+        # Sections are shared with the parse cache, so they are read-only
+        with pytest.raises(TypeError):
+            common_params["vis"] = "other.ms"
+
     def test_get_slurm_config(self, sample_def_file):
         """Test getting SLURM configuration"""
         parser = ConfigParser(str(sample_def_file))
         slurm_config = parser.get_slurm_config()
 
-        assert isinstance(slurm_config, dict)
+        assert isinstance(slurm_config, Mapping)
         assert "account" in slurm_config
         assert "email" in slurm_config
         assert "gpu_type" in slurm_config
@@ -73,7 +162,7 @@ basename = test_run
         parser = ConfigParser(str(sample_def_file))
         coyote_params = parser.get_app_params("coyote")
 
-        assert isinstance(coyote_params, dict)
+        assert isinstance(coyote_params, Mapping)
         assert len(coyote_params) > 0
         assert "wplanes" in coyote_params
         assert "cfcache" in coyote_params
@@ -85,36 +174,42 @@ basename = test_run
         parser = ConfigParser(str(sample_def_file))
         missing_params = parser.get_app_params("nonexistent")
 
-        assert isinstance(missing_params, dict)
+        assert isinstance(missing_params, Mapping)
         assert len(missing_params) == 0
 
-    def test_get_gpu_resources_valid_types(self, sample_def_file):
+    @pytest.mark.parametrize("gpu_type", ["h200", "l40s", "a100", "v100s"])
+    def test_get_gpu_resources_valid_types(self, sample_def_file, gpu_type):
         """Test getting GPU resources for valid GPU types"""
         parser = ConfigParser(str(sample_def_file))
+        gpu_resources = parser.get_gpu_resources(gpu_type)
 
-        # Test each supported GPU type
-        gpu_types = ["h200", "l40s", "a100", "v100s"]
-
-        for gpu_type in gpu_types:
-            gpu_resources = parser.get_gpu_resources(gpu_type)
+        assert isinstance(gpu_resources, dict)
+        assert _EXPECTED_GPU_KEYS <= gpu_resources.keys()
+        assert gpu_resources["constraint"] == gpu_type
 
-            assert isinstance(gpu_resources, dict)
-            assert "constraint" in gpu_resources
-            assert "cpu_mem_per_gpu" in gpu_resources
-            assert "gpu_mem" in gpu_resources
-            assert "default_gpu_walltime" in gpu_resources
-            assert gpu_resources["constraint"] == gpu_type
-
-        # Test specific values for h200
+    def test_get_gpu_resources_h200_values(self, sample_def_file):
+        """Test specific GPU resource values for h200"""
+        parser = ConfigParser(str(sample_def_file))
         h200_resources = parser.get_gpu_resources("h200")
+
         assert h200_resources["gpu_mem"] == "141GB"
         assert h200_resources["cpu_mem_per_gpu"] == "128GB"
 
+    def test_patch_instance_method(self, sample_def_file):
+        """Test getters can be patched per instance, e.g. in job tests"""
+        parser = ConfigParser(str(sample_def_file))
+
+        with patch.object(
+            parser, "get_slurm_config", return_value={"gpu_type": "a100"}
+        ):
+            assert parser.get_slurm_config() == {"gpu_type": "a100"}
+        assert parser.get_slurm_config()["account"] == "test_account"
+
     def test_get_gpu_resources_invalid_type(self, sample_def_file):
         """Test getting GPU resources for invalid GPU type"""
         parser = ConfigParser(str(sample_def_file))
 
-        with pytest.raises(ValueError, match="Unsupported GPU type 'invalid_gpu'"):
+        with pytest.raises(ValueError, match=_RE_BAD_GPU):
             parser.get_gpu_resources("invalid_gpu")
 
     def test_validate_required_params_success(self, sample_def_file):
@@ -124,7 +219,7 @@ basename = test_run
         # Should not raise exception
         parser.validate_required_params()
 
-    def test_validate_required_params_missing_common(self, temp_dir):
+    def test_validate_required_params_missing_common(self):
         """Test validation with missing common parameters"""
         incomplete_def = """[common]
 # Missing 'vis' and 'basename'
@@ -135,16 +230,12 @@ account = test_account
 email = user@msu.edu
 """
 
-        def_file = temp_dir / "incomplete.def"
-        with open(def_file, "w") as f:
-            f.write(incomplete_def)
+        parser = ConfigParser.from_text(incomplete_def)
 
-        parser = ConfigParser(str(def_file))
-
-        with pytest.raises(ValueError, match="Missing required.*common.*parameters"):
+        with pytest.raises(ValueError, match=_RE_MISSING_COMMON):
             parser.validate_required_params()
 
-    def test_validate_required_params_missing_slurm(self, temp_dir):
+    def test_validate_required_params_missing_slurm(self):
         """Test validation with missing SLURM parameters"""
         incomplete_def = """[common]
 vis = test.ms
@@ -155,13 +246,9 @@ basename = test_run
 gpu_type = h200
 """
 
-        def_file = temp_dir / "incomplete.def"
-        with open(def_file, "w") as f:
-            f.write(incomplete_def)
-
-        parser = ConfigParser(str(def_file))
+        parser = ConfigParser.from_text(incomplete_def)
 
-        with pytest.raises(ValueError, match="Missing required.*slurm.*parameters"):
+        with pytest.raises(ValueError, match=_RE_MISSING_SLURM):
             parser.validate_required_params()
 
     def test_get_all_sections(self, sample_def_file):
@@ -177,30 +264,37 @@ gpu_type = h200
         assert "hummbee" in sections
         assert "dale" in sections
 
-    def test_print_config_summary(self, sample_def_file, capsys):
+    def test_print_config_summary(self, sample_def_file):
         """Test printing configuration summary"""
         parser = ConfigParser(str(sample_def_file))
-        parser.print_config_summary()
+        buf = io.StringIO()
+        parser.print_config_summary(file=buf)
 
-        captured = capsys.readouterr()
-        assert "Configuration file:" in captured.out
-        assert "Sections found:" in captured.out
-        assert "[common] parameters:" in captured.out
-        assert "[slurm] configuration:" in captured.out
+        output = buf.getvalue()
+        assert "Configuration file:" in output
+        assert "Sections found:" in output
+        assert "[common] parameters:" in output
+        assert "[slurm] configuration:" in output
 
     def test_print_all_sections(self, sample_def_file, capsys):
         """Test printing all sections"""
         parser = ConfigParser(str(sample_def_file))
+        buf = io.StringIO()
+        parser.print_all_sections(file=buf)
+
+        output = buf.getvalue()
+        assert "Configuration file:" in output
+        assert "[common]" in output
+        assert "[slurm]" in output
+        assert "[coyote]" in output
+        assert "vis = test_sim.ms" in output
+        assert output == parser.format_all_sections()
+
+        # Without a file argument the output still goes to stdout
         parser.print_all_sections()
+        assert capsys.readouterr().out == output
 
-        captured = capsys.readouterr()
-        assert "Configuration file:" in captured.out
-        assert "[common]" in captured.out
-        assert "[slurm]" in captured.out
-        assert "[coyote]" in captured.out
-        assert "vis = test_sim.ms" in captured.out
-
-    def test_empty_sections_handling(self, temp_dir):
+    def test_empty_sections_handling(self):
         """Test handling of empty sections"""
         def_with_empty_sections = """[common]
 vis = test.ms
@@ -222,11 +316,7 @@ wplanes = 1
 param1 = value1
 """
 
-        def_file = temp_dir / "empty_sections.def"
-        with open(def_file, "w") as f:
-            f.write(def_with_empty_sections)
-
-        parser = ConfigParser(str(def_file))
+        parser = ConfigParser.from_text(def_with_empty_sections)
 
         # Test empty sections
         empty_params = parser.get_app_params("roadrunner")
@@ -240,7 +330,7 @@ param1 = value1
         assert len(coyote_params) == 1
         assert coyote_params["wplanes"] == "1"
 
-    def test_parameter_values_with_special_characters(self, temp_dir):
+    def test_parameter_values_with_special_characters(self):
         """Test handling parameters with special characters and empty values"""
         special_def = """[common]
 vis = test file with spaces.ms
@@ -258,11 +348,7 @@ comment = # This is a comment value
 equals_in_value = key=value=more
 """
 
-        def_file = temp_dir / "special.def"
-        with open(def_file, "w") as f:
-            f.write(special_def)
-
-        parser = ConfigParser(str(def_file))
+        parser = ConfigParser.from_text(special_def)
 
         common_params = parser.get_common_params()
         assert common_params["vis"] == "test file with spaces.ms"
@@ -275,10 +361,120 @@ equals_in_value = key=value=more
         assert "equals_in_value" in coyote_params
 
 
+class TestFastConfigParser:
+    """Test FastConfigParser parity with the stdlib configparser"""
+
+    def test_matches_stdlib_parser(self, sample_def_file):
+        """Test fast and strict parsing give identical sections"""
+        fast = ConfigParser(str(sample_def_file))
+        strict = ConfigParser(str(sample_def_file), strict=True)
+
+        assert isinstance(fast.config, FastConfigParser)
+        assert fast.get_all_sections() == strict.get_all_sections()
+        for section in fast.get_all_sections():
+            assert fast.get_app_params(section) == strict.get_app_params(section)
+
+    @pytest.mark.parametrize("indent", ["  ", "\t"], ids=["spaces", "tab"])
+    def test_indented_def_matches_stdlib(self, sample_def_content, indent):
+        """Test a .def file with uniformly indented keys parses like the stdlib"""
+        text = "".join(
+            line if line.startswith("[") else indent + line
+            for line in sample_def_content.splitlines(keepends=True)
+        )
+
+        fast = ConfigParser.from_text(text)
+        strict = ConfigParser.from_text(text, strict=True)
+
+        assert fast.get_all_sections() == strict.get_all_sections()
+        for section in fast.get_all_sections():
+            assert fast.get_app_params(section) == strict.get_app_params(section)
+        assert fast.get_common_params()["basename"] == "test_run"
+
+    def test_comments_case_and_continuation(self):
+        """Test comment, key case and continuation-line handling"""
+        parser = FastConfigParser()
+        parser.read_string("""; leading comment
+[coyote]
+# full-line comment
+WPlanes = 4
+spw: 0:100~900
+scales = 0,3,
+    10,30
+""")
+
+        assert parser.sections() == ["coyote"]
+        assert parser["coyote"] == {
+            "wplanes": "4",
+            "spw": "0:100~900",
+            "scales": "0,3,\n10,30",
+        }
+
+    def test_option_before_section(self):
+        """Test options outside a section are rejected"""
+        parser = FastConfigParser()
+
+        with pytest.raises(ValueError, match=_RE_NO_SECTION):
+            parser.read_string("vis = test.ms\n")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "[a]\nk = 1\n\n  2\n",
+            "[a]\nk = 1\n\n\n  2\n\n[b]\nj = 3\n",
+            "[a]\nk = 1\n# c\n  2\n",
+            "[a]\nk = 1\n\n  # c\n  2\n",
+            "[a]\nk =\n  2\n",
+            "[DEFAULT]\nq = 9\nk = 0\n[a]\nk = 1\n[b]\nj = 2\n",
+            "[common]\n  vis = a.ms\n  basename = run\n",
+            "[a]\n\tk = 1\n\tj = 2\n\t\tmore\n\n\t\tand more\n",
+            "  [a]\n    k = 1\n      2\n    j = 3\n",
+            "[a]\n  k = 1\n  # c\n    2\n j = 3\n",
+            "[a]b]\nk = 1\n[c] trailing\nj = 2\n",
+        ],
+        ids=[
+            "blank-in-continuation",
+            "blanks-then-section",
+            "comment-in-continuation",
+            "blank-then-comment",
+            "empty-then-continuation",
+            "default-inherited",
+            "indented-keys",
+            "tab-indented",
+            "indented-header",
+            "dedent-ends-value",
+            "bracket-in-header",
+        ],
+    )
+    def test_parity_edge_cases(self, text):
+        """Test FastConfigParser and the stdlib agree on .ini edge cases"""
+        fast = FastConfigParser()
+        fast.read_string(text)
+        stdlib = configparser.RawConfigParser(interpolation=None)
+        stdlib.read_string(text)
+
+        assert fast.sections() == stdlib.sections()
+        for section in fast.sections():
+            assert fast[section] == dict(stdlib[section])
+
+    @pytest.mark.parametrize(
+        "text, error",
+        [
+            ("[a]\nk = 1\nK = 2\n", configparser.DuplicateOptionError),
+            ("[a]\nk = 1\n[a]\nj = 2\n", configparser.DuplicateSectionError),
+        ],
+        ids=["option", "section"],
+    )
+    def test_duplicates_rejected(self, text, error):
+        """Test a repeated option or section raises like the stdlib"""
+        for parser in (FastConfigParser(), configparser.RawConfigParser()):
+            with pytest.raises(error, match="line  3"):
+                parser.read_string(text)
+
+
 class TestConfigParserIntegration:
     """Integration tests for ConfigParser"""
 
-    def test_realistic_pipeline_config(self, temp_dir):
+    def test_realistic_pipeline_config(self):
         """Test with a realistic complete pipeline configuration"""
         realistic_def = """[common]
 vis = VLASS_J123456+789012.ms
@@ -334,11 +530,7 @@ pblimit = 0.1
 normalize_by = peak
 """
 
-        def_file = temp_dir / "realistic.def"
-        with open(def_file, "w") as f:
-            f.write(realistic_def)
-
-        parser = ConfigParser(str(def_file))
+        parser = ConfigParser.from_text(realistic_def)
 
         # Validate it parses correctly
         parser.validate_required_params()
@@ -361,9 +553,7 @@ normalize_by = peak
         gpu_resources = parser.get_gpu_resources("a100")
         assert gpu_resources["gpu_mem"] == "80GB"
 
-        print("Realistic pipeline configuration test passed! ✓")
-
-    def test_minimal_valid_config(self, temp_dir):
+    def test_minimal_valid_config(self):
         """Test with minimal valid configuration"""
         minimal_def = """[common]
 vis = minimal.ms
@@ -374,11 +564,7 @@ account = test
 email = test@example.com
 """
 
-        def_file = temp_dir / "minimal.def"
-        with open(def_file, "w") as f:
-            f.write(minimal_def)
-
-        parser = ConfigParser(str(def_file))
+        parser = ConfigParser.from_text(minimal_def)
         parser.validate_required_params()  # Should not raise
 
         # All app sections should return empty dicts
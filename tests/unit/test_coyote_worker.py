@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+tests/unit/test_coyote_worker.py
+
+Unit tests for the coyote worker that runs inside SLURM job scripts
+"""
+
+import pytest
+import json
+import os
+import stat
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from slurm_pipeline.workers import coyote_worker
+from slurm_pipeline.workers.coyote_worker import (
+    CoyoteWorker,
+    _stat_mode,
+    load_json_params,
+)
+
+_COMMON = {"vis": "test.ms", "basename": "test_run", "iterations": "3"}
+_APP = {"wplanes": "1"}
+
+
+class _Exec(Exception):
+    """Raised by the fake os.execvp in place of replacing the process"""
+
+
+@pytest.fixture
+def data_cwd(temp_dir, mock_data_dir, monkeypatch):
+    """Run the test from temp_dir, which holds data/nrao/VLA/VLA.surface"""
+    monkeypatch.chdir(temp_dir)
+    # setup_environment writes CASAPATH; make sure it is restored afterwards
+    monkeypatch.setenv("CASAPATH", "unset")
+    return temp_dir
+
+
+@pytest.fixture
+def worker(data_cwd, dummy_coyote_binary):
+    """CoyoteWorker with four processes and a cache directory under temp_dir"""
+    return CoyoteWorker(
+        cfcache_dir=str(data_cwd / "test.cf"),
+        nprocs=4,
+        coyote_app=str(dummy_coyote_binary),
+        common_params=_COMMON,
+        app_params=_APP,
+    )
+
+
+@pytest.fixture
+def fake_execvp(monkeypatch):
+    """
+    Replace os.execvp and spy on stdout/stderr flushes
+
+    Returns the list of recorded calls: (file, argv, stdout flushed,
+    stderr flushed). The fake raises _Exec, since a real exec never returns.
+    """
+    calls = []
+    streams = SimpleNamespace(stdout=MagicMock(), stderr=MagicMock())
+    monkeypatch.setattr(coyote_worker, "sys", streams)
+
+    def execvp(file, argv):
+        calls.append(
+            (
+                file,
+                list(argv),
+                streams.stdout.flush.called,
+                streams.stderr.flush.called,
+            )
+        )
+        raise _Exec
+
+    monkeypatch.setattr(os, "execvp", execvp)
+    return calls
+
+
+class TestCoyoteWorker:
+    """Test CoyoteWorker command building and execution"""
+
+    def test_build_coyote_command(self, worker, data_cwd, dummy_coyote_binary):
+        """Test pipeline-only params are dropped and mode args appended"""
+        base = [
+            str(dummy_coyote_binary),
+            "help=noprompt",
+            "vis=test.ms",
+            "wplanes=1",
+            f"cfcache={data_cwd / 'test.cf'}",
+        ]
+
+        assert worker.build_coyote_command("dryrun") == base
+        assert worker.build_coyote_command("fillcf", 2) == [
+            *base,
+            "nprocs=4",
+            "procid=2",
+        ]
+
+        with pytest.raises(ValueError, match="requires process_id"):
+            worker.build_coyote_command("fillcf")
+        with pytest.raises(ValueError, match="Unknown mode"):
+            worker.build_coyote_command("bogus")
+
+    def test_run_dryrun_execs_coyote(self, worker, data_cwd, fake_execvp):
+        """Test dryrun flushes output, then replaces the process with coyote"""
+        with pytest.raises(_Exec):
+            worker.run_dryrun()
+
+        [(file, argv, stdout_flushed, stderr_flushed)] = fake_execvp
+        assert file == argv[0]
+        assert argv == worker.build_coyote_command("dryrun")
+        assert stdout_flushed and stderr_flushed
+        assert (data_cwd / "test.cf").is_dir()
+        assert os.environ["CASAPATH"] == str((data_cwd / "data").absolute())
+
+    def test_run_fillcf_execs_coyote(self, worker, data_cwd, fake_execvp, monkeypatch):
+        """Test fillcf passes the array task ID to coyote as procid"""
+        (data_cwd / "test.cf").mkdir()
+        monkeypatch.setenv("SLURM_ARRAY_TASK_ID", "2")
+
+        with pytest.raises(_Exec):
+            worker.run_fillcf()
+
+        [(_, argv, _, _)] = fake_execvp
+        assert argv == worker.build_coyote_command("fillcf", 2)
+
+    @pytest.mark.parametrize(
+        "task_id, make_cache, message",
+        [
+            (None, True, "SLURM_ARRAY_TASK_ID not found"),
+            ("x", True, "Invalid SLURM_ARRAY_TASK_ID"),
+            ("2", False, "CF cache directory does not exist"),
+        ],
+        ids=["no-task-id", "bad-task-id", "no-cache"],
+    )
+    def test_run_fillcf_errors(
+        self,
+        worker,
+        data_cwd,
+        fake_execvp,
+        monkeypatch,
+        capsys,
+        task_id,
+        make_cache,
+        message,
+    ):
+        """Test fillcf returns 1 without exec'ing when its inputs are wrong"""
+        if task_id is None:
+            monkeypatch.delenv("SLURM_ARRAY_TASK_ID", raising=False)
+        else:
+            monkeypatch.setenv("SLURM_ARRAY_TASK_ID", task_id)
+        if make_cache:
+            (data_cwd / "test.cf").mkdir()
+
+        assert worker.run_fillcf() == 1
+        assert message in capsys.readouterr().out
+        assert fake_execvp == []
+
+    def test_exec_failure_returns_one(self, worker, monkeypatch, capsys):
+        """Test an exec that cannot start coyote is reported as exit code 1"""
+
+        def execvp(file, argv):
+            raise FileNotFoundError(2, "No such file or directory", file)
+
+        monkeypatch.setattr(os, "execvp", execvp)
+
+        assert worker.run_dryrun() == 1
+        assert "Dryrun failed with error" in capsys.readouterr().out
+
+
+class TestWorkerValidation:
+    """Test the checks CoyoteWorker runs before any command"""
+
+    def test_coyote_app_missing(self, data_cwd):
+        """Test a missing coyote executable is rejected"""
+        with pytest.raises(FileNotFoundError, match="Coyote executable not found"):
+            CoyoteWorker(str(data_cwd / "cf"), 4, str(data_cwd / "no_coyote"))
+
+    def test_coyote_app_directory(self, data_cwd):
+        """Test a directory in place of the coyote executable is rejected"""
+        with pytest.raises(ValueError, match="not a file"):
+            CoyoteWorker(str(data_cwd / "cf"), 4, str(data_cwd))
+
+    def test_invalid_nprocs(self, data_cwd, dummy_coyote_binary):
+        """Test a non-positive process count is rejected"""
+        with pytest.raises(ValueError, match="Invalid number of processes"):
+            CoyoteWorker(str(data_cwd / "cf"), 0, str(dummy_coyote_binary))
+
+    @pytest.mark.parametrize(
+        "layout, message",
+        [
+            ({}, "Data directory not found"),
+            ({"data": "file"}, "Data directory not found"),
+            ({"data": "dir"}, "VLA surface file not found"),
+            ({"data/nrao/VLA/VLA.surface": "dir"}, "VLA surface file not found"),
+        ],
+        ids=["no-data", "data-is-file", "no-surface", "surface-is-dir"],
+    )
+    def test_validate_data_environment(
+        self, temp_dir, dummy_coyote_binary, monkeypatch, layout, message
+    ):
+        """Test missing or wrongly typed data paths are rejected"""
+        monkeypatch.chdir(temp_dir)
+        for rel_path, kind in layout.items():
+            path = temp_dir / rel_path
+            if kind == "dir":
+                path.mkdir(parents=True)
+            else:
+                path.write_text("")
+
+        with pytest.raises(FileNotFoundError, match=message):
+            CoyoteWorker(str(temp_dir / "cf"), 4, str(dummy_coyote_binary))
+
+
+class TestWorkerHelpers:
+    """Test the worker's module-level helpers"""
+
+    def test_stat_mode(self, temp_dir):
+        """Test _stat_mode returns st_mode, or None for unreachable paths"""
+        regular = temp_dir / "file"
+        regular.write_text("")
+
+        assert stat.S_ISREG(_stat_mode(regular))
+        assert stat.S_ISDIR(_stat_mode(temp_dir))
+        assert _stat_mode(temp_dir / "missing") is None
+        # A path "under" a regular file raises NotADirectoryError
+        assert _stat_mode(regular / "child") is None
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_load_json_params(self, temp_dir, monkeypatch, use_orjson):
+        """Test JSON loading with and without orjson, and bad input"""
+        if not use_orjson:
+            monkeypatch.setattr(coyote_worker, "_HAVE_ORJSON", False)
+        elif not coyote_worker._HAVE_ORJSON:
+            pytest.skip("orjson not installed")
+
+        params_file = temp_dir / "params.json"
+        params_file.write_text(json.dumps(_COMMON))
+        assert load_json_params(str(params_file)) == _COMMON
+
+        params_file.write_text("{not json")
+        assert load_json_params(str(params_file)) == {}
+        assert load_json_params(str(temp_dir / "missing.json")) == {}
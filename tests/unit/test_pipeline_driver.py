@@ -8,9 +8,10 @@ Unit tests for PipelineDriver class
 import pytest
 import subprocess
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from slurm_pipeline.core import PipelineDriver, ConfigParser
+from slurm_pipeline.core import PipelineDriver
 
 
 class MockApplication:
@@ -29,69 +30,161 @@ class MockApplication:
         return self.mock_jobs
 
 
+# Job graph shapes shared by the ordering and validation tests
+_JOB_GRAPHS = {
+    # job1 -> job2 -> job3
+    "linear3": [
+        {"job_name": "job1", "type": "single", "script_path": "/tmp/job1.sh"},
+        {
+            "job_name": "job2",
+            "type": "single",
+            "script_path": "/tmp/job2.sh",
+            "depends_on_job": "job1",
+        },
+        {
+            "job_name": "job3",
+            "type": "single",
+            "script_path": "/tmp/job3.sh",
+            "depends_on_job": "job2",
+        },
+    ],
+    # spw0 and spw1 are independent; merge depends on spw0
+    "fanout": [
+        {"job_name": "spw0", "type": "single", "script_path": "/tmp/spw0.sh"},
+        {"job_name": "spw1", "type": "single", "script_path": "/tmp/spw1.sh"},
+        {
+            "job_name": "merge",
+            "type": "single",
+            "script_path": "/tmp/merge.sh",
+            "depends_on_job": "spw0",
+        },
+    ],
+    "single": [
+        {
+            "job_name": "test_job",
+            "type": "single",
+            "script_path": "/tmp/test.sh",
+            "phase": "test",
+        }
+    ],
+}
+
+
+# CoyoteJob-like dryrun -> fillcf pair; script_path holds a script name
+# that _coyote_jobs resolves through script_factory
+_COYOTE_JOB_TEMPLATE = (
+    {
+        "job_name": "test_run_coyote_dryrun",
+        "type": "single",
+        "phase": "dryrun",
+        "script_path": "coyote_dryrun.sh",
+        "depends_on": None,
+    },
+    {
+        "job_name": "test_run_coyote_fillcf",
+        "type": "array",
+        "phase": "fillcf",
+        "script_path": "coyote_fillcf.sh",
+        "depends_on_job": "test_run_coyote_dryrun",
+        "array_range": "0-7",
+    },
+)
+
+
+def _coyote_jobs(script_factory):
+    """Copy _COYOTE_JOB_TEMPLATE with real, executable script paths"""
+    return [
+        {**job, "script_path": str(script_factory(job["script_path"]))}
+        for job in _COYOTE_JOB_TEMPLATE
+    ]
+
+
+def _install_fake_graph(driver, edges):
+    """
+    Register jobs and dependencies on driver directly, without applications
+
+    edges maps each job name to the names it depends on.
+    """
+    for job_name, deps in edges.items():
+        driver.job_scripts[job_name] = {
+            "job_name": job_name,
+            "type": "single",
+            "script_path": f"/tmp/{job_name}.sh",
+        }
+        driver.job_dependencies[job_name] = list(deps)
+
+
+@pytest.fixture
+def driver(shared_scripts_dir, parsed_config):
+    """
+    Fresh PipelineDriver working in the shared scripts directory
+
+    PipelineDriver never writes into its working directory, so the tests
+    need no per-test directory of their own.
+    """
+    return PipelineDriver(parsed_config, str(shared_scripts_dir))
+
+
+@pytest.fixture
+def loaded_driver(driver):
+    """
+    Return a callable that adds an application and generates its scripts
+
+    Generation runs in dry-run mode; the callable returns the driver.
+    """
+
+    def load(app_name, app):
+        driver.add_application(app_name, app)
+        driver.generate_all_scripts(dry_run=True)
+        return driver
+
+    return load
+
+
+@pytest.fixture
+def mock_sbatch(monkeypatch):
+    """Replace subprocess.run with a MagicMock for the duration of a test"""
+    mock_run = MagicMock()
+    monkeypatch.setattr("subprocess.run", mock_run)
+    return mock_run
+
+
+@pytest.fixture
+def mock_app(request):
+    """
+    MockApplication from an indirect (name, jobs) or (name, jobs, exc) param
+
+    When exc is given, validate_requirements raises it.
+    """
+    name, jobs, *exc = request.param
+    app = MockApplication(name, list(jobs))
+    if exc:
+        app.validate_requirements = MagicMock(side_effect=exc[0])
+    return app
+
+
 class TestPipelineDriver:
     """Test PipelineDriver functionality"""
 
-    def test_initialization(self, temp_dir, sample_def_file):
+    def test_initialization(self, driver, shared_scripts_dir):
         """Test PipelineDriver initialization"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        assert driver.working_dir == temp_dir
+        assert driver.working_dir == shared_scripts_dir
         assert len(driver.applications) == 0
         assert len(driver.job_scripts) == 0
 
-    def test_add_application(self, temp_dir, sample_def_file):
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["single"])], indirect=True
+    )
+    def test_add_application(self, driver, mock_app):
         """Test adding applications to pipeline"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        mock_jobs = [
-            {
-                "job_name": "test_job_1",
-                "type": "single",
-                "script_path": str(temp_dir / "test1.sh"),
-                "phase": "test",
-            }
-        ]
-
-        mock_app = MockApplication("test_app", mock_jobs)
         driver.add_application("test_app", mock_app)
 
         assert "test_app" in driver.applications
         assert driver.applications["test_app"] == mock_app
 
-    def test_generate_all_scripts(self, temp_dir, sample_def_file):
+    def test_generate_all_scripts(self, driver, script_factory):
         """Test script generation for all applications"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Create mock script files
-        script1 = temp_dir / "dryrun.sh"
-        script2 = temp_dir / "fillcf.sh"
-        for script in [script1, script2]:
-            script.write_text('#!/bin/bash\necho "mock script"')
-            script.chmod(0o755)
-
-        # Mock coyote jobs
-        coyote_jobs = [
-            {
-                "job_name": "test_run_coyote_dryrun",
-                "type": "single",
-                "phase": "dryrun",
-                "script_path": str(script1),
-                "depends_on": None,
-            },
-            {
-                "job_name": "test_run_coyote_fillcf",
-                "type": "array",
-                "phase": "fillcf",
-                "script_path": str(script2),
-                "depends_on_job": "test_run_coyote_dryrun",
-            },
-        ]
-
-        mock_coyote = MockApplication("coyote", coyote_jobs)
+        mock_coyote = MockApplication("coyote", _coyote_jobs(script_factory))
         driver.add_application("coyote", mock_coyote)
 
         # Generate scripts
@@ -108,20 +201,12 @@ class TestPipelineDriver:
             in driver.job_dependencies["test_run_coyote_fillcf"]
         )
 
-    def test_pipeline_validation_success(self, temp_dir, sample_def_file):
+    @pytest.mark.parametrize(
+        "mock_app", [("valid_app", _JOB_GRAPHS["single"])], indirect=True
+    )
+    def test_pipeline_validation_success(self, loaded_driver, mock_app):
         """Test successful pipeline validation"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Add valid mock application
-        mock_jobs = [
-            {"job_name": "valid_job", "type": "single", "script_path": "/tmp/test.sh"}
-        ]
-        mock_app = MockApplication("valid_app", mock_jobs)
-        driver.add_application("valid_app", mock_app)
-
-        # Generate jobs to populate job_scripts
-        driver.generate_all_scripts(dry_run=True)
+        driver = loaded_driver("valid_app", mock_app)
 
         # Validate
         is_valid, errors = driver.validate_pipeline()
@@ -129,24 +214,14 @@ class TestPipelineDriver:
         assert is_valid is True
         assert len(errors) == 0
 
-    def test_pipeline_validation_failure(self, temp_dir, sample_def_file):
+    @pytest.mark.parametrize(
+        "mock_app",
+        [("invalid_app", _JOB_GRAPHS["single"], ValueError("Invalid config"))],
+        indirect=True,
+    )
+    def test_pipeline_validation_failure(self, loaded_driver, mock_app):
         """Test pipeline validation with invalid application"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Create mock application that fails validation
-        mock_jobs = [
-            {"job_name": "invalid_job", "type": "single", "script_path": "/tmp/test.sh"}
-        ]
-        mock_app = MockApplication("invalid_app", mock_jobs)
-
-        # Override validation to raise exception
-        mock_app.validate_requirements = MagicMock(
-            side_effect=ValueError("Invalid config")
-        )
-
-        driver.add_application("invalid_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+        driver = loaded_driver("invalid_app", mock_app)
 
         # Validate
         is_valid, errors = driver.validate_pipeline()
@@ -155,31 +230,12 @@ class TestPipelineDriver:
         assert len(errors) == 1
         assert "Invalid config" in errors[0]
 
-    def test_submission_order(self, temp_dir, sample_def_file):
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["linear3"])], indirect=True
+    )
+    def test_submission_order(self, loaded_driver, mock_app):
         """Test job submission order calculation"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Create jobs with dependencies: job1 -> job2 -> job3
-        mock_jobs = [
-            {"job_name": "job1", "type": "single", "script_path": "/tmp/job1.sh"},
-            {
-                "job_name": "job2",
-                "type": "single",
-                "script_path": "/tmp/job2.sh",
-                "depends_on_job": "job1",
-            },
-            {
-                "job_name": "job3",
-                "type": "single",
-                "script_path": "/tmp/job3.sh",
-                "depends_on_job": "job2",
-            },
-        ]
-
-        mock_app = MockApplication("test_app", mock_jobs)
-        driver.add_application("test_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+        driver = loaded_driver("test_app", mock_app)
 
         submission_order = driver._get_submission_order()
 
@@ -187,172 +243,204 @@ class TestPipelineDriver:
         assert submission_order.index("job1") < submission_order.index("job2")
         assert submission_order.index("job2") < submission_order.index("job3")
 
-    def test_circular_dependency_detection(self, temp_dir, sample_def_file):
-        """Test detection of circular dependencies"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["fanout"])], indirect=True
+    )
+    def test_submission_waves(self, loaded_driver, mock_app):
+        """Test independent jobs are grouped into one submission wave"""
+        driver = loaded_driver("test_app", mock_app)
 
-        # Create jobs with circular dependency: job1 -> job2 -> job1
-        mock_jobs = [
-            {
-                "job_name": "job1",
-                "type": "single",
-                "script_path": "/tmp/job1.sh",
-                "depends_on_job": "job2",
-            },
+        assert driver._get_submission_waves() == [["spw0", "spw1"], ["merge"]]
+
+    @pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+    def test_generate_all_scripts_parallel(self, driver, parallel):
+        """Test opt-in concurrent generation registers the same jobs in order"""
+        driver.add_application("a", MockApplication("a", _JOB_GRAPHS["linear3"]))
+        driver.add_application("b", MockApplication("b", _JOB_GRAPHS["single"]))
+
+        generated_jobs = driver.generate_all_scripts(dry_run=True, parallel=parallel)
+
+        assert list(generated_jobs) == ["a", "b"]
+        assert list(driver.job_scripts) == ["job1", "job2", "job3", "test_job"]
+        assert driver.job_dependencies["job3"] == ["job2"]
+
+    def test_cross_application_dependencies(self, driver):
+        """Test registered app dependencies link terminal jobs to entry jobs"""
+        coyote_jobs = [
+            {"job_name": "dryrun", "type": "single", "script_path": "/tmp/dryrun.sh"},
             {
-                "job_name": "job2",
-                "type": "single",
-                "script_path": "/tmp/job2.sh",
-                "depends_on_job": "job1",
+                "job_name": "fillcf",
+                "type": "array",
+                "script_path": "/tmp/fillcf.sh",
+                "depends_on_job": "dryrun",
             },
         ]
+        roadrunner_jobs = [
+            {"job_name": "grid", "type": "gpu", "script_path": "/tmp/grid.sh"}
+        ]
 
-        mock_app = MockApplication("test_app", mock_jobs)
-        driver.add_application("test_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+        driver.add_application("coyote", MockApplication("coyote", coyote_jobs))
+        driver.add_application(
+            "roadrunner",
+            MockApplication("roadrunner", roadrunner_jobs),
+            depends_on=["coyote"],
+        )
+        driver.generate_all_scripts(dry_run=False)
 
-        # Force circular dependency
-        driver.job_dependencies["job1"] = ["job2"]
-        driver.job_dependencies["job2"] = ["job1"]
+        assert driver.job_dependencies["grid"] == ["fillcf"]
+
+        # Depending on an application that was never added is an error
+        driver.add_application(
+            "dale", MockApplication("dale", []), depends_on=["hummbee"]
+        )
+        with pytest.raises(ValueError, match="unknown application 'hummbee'"):
+            driver.generate_all_scripts(dry_run=False)
+
+    def test_circular_dependency_detection(self, driver):
+        """Test detection of circular dependencies"""
+        # job1 -> job2 -> job1
+        _install_fake_graph(driver, {"job1": ["job2"], "job2": ["job1"]})
 
         is_valid, errors = driver.validate_pipeline()
 
         assert is_valid is False
         assert any("Circular dependency" in error for error in errors)
 
-    @patch("subprocess.run")
-    def test_submit_pipeline_dry_run(self, mock_run, temp_dir, sample_def_file):
-        """Test pipeline submission in dry run mode"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Create mock script file
-        script_path = temp_dir / "test_job.sh"
-        script_path.write_text('#!/bin/bash\necho "test"')
-        script_path.chmod(0o755)
-
-        mock_jobs = [
-            {
-                "job_name": "test_job",
+    @pytest.mark.parametrize(
+        "jobs_spec,dry_run,sbatch_returns,expected",
+        [
+            pytest.param(
+                [("test_job", None)],
+                True,
+                [],
+                {"test_job": "DRY_RUN_test_job"},
+                id="dry_run",
+            ),
+            pytest.param(
+                [("job1", None), ("job2", "job1")],
+                False,
+                ["12345", "12346"],
+                {"job1": "12345", "job2": "12346"},
+                id="with_dependencies",
+            ),
+        ],
+    )
+    def test_submit_pipeline(
+        self,
+        mock_sbatch,
+        loaded_driver,
+        script_factory,
+        jobs_spec,
+        dry_run,
+        sbatch_returns,
+        expected,
+    ):
+        """Test pipeline submission, in dry run mode and through sbatch"""
+        mock_jobs = []
+        for job_name, parent in jobs_spec:
+            job = {
+                "job_name": job_name,
                 "type": "single",
-                "script_path": str(script_path),
-                "phase": "test",
+                "script_path": str(script_factory(f"{job_name}.sh")),
             }
-        ]
+            if parent:
+                job["depends_on_job"] = parent
+            mock_jobs.append(job)
 
-        mock_app = MockApplication("test_app", mock_jobs)
-        driver.add_application("test_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+        driver = loaded_driver("test_app", MockApplication("test_app", mock_jobs))
 
-        # Mock successful sbatch call
-        mock_run.return_value.stdout = "sbatch: Job submission test successful"
-        mock_run.return_value.returncode = 0
+        # Mock sbatch responses, one per submitted job
+        mock_sbatch.side_effect = [
+            SimpleNamespace(stdout=f"Submitted batch job {job_id}", returncode=0)
+            for job_id in sbatch_returns
+        ]
 
-        # Submit in dry run mode
-        submitted_jobs = driver.submit_pipeline(dry_run=True)
+        submitted_jobs = driver.submit_pipeline(dry_run=dry_run)
 
-        assert "test_job" in submitted_jobs
-        assert submitted_jobs["test_job"].startswith("DRY_RUN_")
+        assert submitted_jobs == expected
+        # Dry run only reports the commands; sbatch is never launched
+        assert mock_sbatch.call_count == len(sbatch_returns)
 
-        # Verify sbatch was called with --test-only
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args[0][0]  # First positional argument (command list)
-        assert "sbatch" in call_args
-        assert "--test-only" in call_args
+        # Dependent jobs are submitted with an afterok on their parent's ID
+        for call, (job_name, parent) in zip(mock_sbatch.call_args_list, jobs_spec):
+            if parent:
+                cmd = call[0][0]
+                dependency_idx = cmd.index("--dependency")
+                assert f"afterok:{expected[parent]}" in cmd[dependency_idx + 1]
 
-    @patch("subprocess.run")
-    def test_submit_pipeline_with_dependencies(
-        self, mock_run, temp_dir, sample_def_file
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["fanout"])], indirect=True
+    )
+    def test_submit_pipeline_concurrent_wave(
+        self, mock_sbatch, loaded_driver, mock_app
     ):
-        """Test pipeline submission with job dependencies"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
+        """Test a multi-job wave is submitted through the thread pool"""
+        driver = loaded_driver("test_app", mock_app)
+        job_ids = {"/tmp/spw0.sh": "100", "/tmp/spw1.sh": "101", "/tmp/merge.sh": "102"}
 
-        # Create mock script files
-        for script_name in ["job1.sh", "job2.sh"]:
-            script_path = temp_dir / script_name
-            script_path.write_text('#!/bin/bash\necho "test"')
-            script_path.chmod(0o755)
+        # Calls from the pool arrive in any order; key the ID on the script
+        mock_sbatch.side_effect = lambda cmd, **kwargs: SimpleNamespace(
+            stdout=f"Submitted batch job {job_ids[cmd[-1]]}", returncode=0
+        )
 
-        mock_jobs = [
-            {
-                "job_name": "job1",
-                "type": "single",
-                "script_path": str(temp_dir / "job1.sh"),
-                "phase": "first",
-            },
-            {
-                "job_name": "job2",
-                "type": "single",
-                "script_path": str(temp_dir / "job2.sh"),
-                "phase": "second",
-                "depends_on_job": "job1",
-            },
-        ]
+        submitted_jobs = driver.submit_pipeline()
 
-        mock_app = MockApplication("test_app", mock_jobs)
-        driver.add_application("test_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+        assert submitted_jobs == {"spw0": "100", "spw1": "101", "merge": "102"}
+        merge_cmd = next(
+            call[0][0]
+            for call in mock_sbatch.call_args_list
+            if call[0][0][-1] == "/tmp/merge.sh"
+        )
+        assert merge_cmd[:3] == ["sbatch", "--dependency", "afterok:100"]
 
-        # Mock sbatch responses
-        mock_run.side_effect = [
-            # First job submission
-            MagicMock(stdout="Submitted batch job 12345", returncode=0),
-            # Second job submission
-            MagicMock(stdout="Submitted batch job 12346", returncode=0),
-        ]
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["fanout"])], indirect=True
+    )
+    def test_submit_pipeline_sibling_failure(
+        self, mock_sbatch, loaded_driver, mock_app
+    ):
+        """Test a failed sbatch keeps its queued siblings and stops the pipeline"""
+        driver = loaded_driver("test_app", mock_app)
 
-        # Submit pipeline
-        submitted_jobs = driver.submit_pipeline(dry_run=False)
+        def sbatch(cmd, **kwargs):
+            if cmd[-1] == "/tmp/spw1.sh":
+                raise subprocess.CalledProcessError(1, cmd, stderr="QOS limit")
+            return SimpleNamespace(stdout="Submitted batch job 100", returncode=0)
 
-        assert len(submitted_jobs) == 2
-        assert submitted_jobs["job1"] == "12345"
-        assert submitted_jobs["job2"] == "12346"
+        mock_sbatch.side_effect = sbatch
 
-        # Verify second job was submitted with dependency
-        second_call_args = mock_run.call_args_list[1][0][0]
-        assert "--dependency" in second_call_args
-        dependency_idx = second_call_args.index("--dependency")
-        assert "afterok:12345" in second_call_args[dependency_idx + 1]
+        with pytest.raises(RuntimeError, match="Failed to submit spw1: QOS limit"):
+            driver.submit_pipeline()
 
-    @patch("subprocess.run")
-    def test_get_job_status(self, mock_run, temp_dir, sample_def_file):
-        """Test job status retrieval"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
+        # spw0 was queued and stays recorded; merge is never submitted
+        assert driver.submitted_jobs == {"spw0": "100"}
+        assert mock_sbatch.call_count == 2
 
+    def test_get_job_status(self, mock_sbatch, driver):
+        """Test job status retrieval"""
         # Set up submitted jobs
         driver.submitted_jobs = {"job1": "12345", "job2": "DRY_RUN_job2"}
 
-        # Mock squeue responses
-        mock_run.side_effect = [
-            MagicMock(stdout="RUNNING", returncode=0),  # job1 status
-            # No call for DRY_RUN job
-        ]
+        # Mock the single batched squeue response
+        mock_sbatch.return_value = SimpleNamespace(
+            stdout="12345 RUNNING\n", returncode=0
+        )
 
         status = driver.get_job_status()
 
         assert status["job1"] == "RUNNING"
         assert status["job2"] == "DRY_RUN"
 
-    def test_print_pipeline_summary(self, temp_dir, sample_def_file, capsys):
-        """Test pipeline summary printing"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        mock_jobs = [
-            {
-                "job_name": "test_job",
-                "type": "single",
-                "script_path": "/tmp/test.sh",
-                "phase": "test",
-            }
-        ]
+        # DRY_RUN jobs are never queried
+        mock_sbatch.assert_called_once()
+        assert mock_sbatch.call_args[0][0][:3] == ["squeue", "-j", "12345"]
 
-        mock_app = MockApplication("test_app", mock_jobs)
-        driver.add_application("test_app", mock_app)
-        driver.generate_all_scripts(dry_run=True)
+    @pytest.mark.parametrize(
+        "mock_app", [("test_app", _JOB_GRAPHS["single"])], indirect=True
+    )
+    def test_print_pipeline_summary(self, loaded_driver, mock_app, capsys):
+        """Test pipeline summary printing"""
+        driver = loaded_driver("test_app", mock_app)
 
         driver.print_pipeline_summary()
 
@@ -365,38 +453,10 @@ class TestPipelineDriver:
 class TestPipelineDriverIntegration:
     """Integration tests for PipelineDriver"""
 
-    def test_full_pipeline_workflow(self, temp_dir, sample_def_file):
+    def test_full_pipeline_workflow(self, driver, script_factory):
         """Test complete pipeline workflow without actual submission"""
-        config = ConfigParser(str(sample_def_file))
-        driver = PipelineDriver(config, str(temp_dir))
-
-        # Create realistic mock jobs similar to CoyoteJob
-        dryrun_script = temp_dir / "coyote_dryrun.sh"
-        fillcf_script = temp_dir / "coyote_fillcf.sh"
-
-        for script in [dryrun_script, fillcf_script]:
-            script.write_text('#!/bin/bash\necho "mock coyote script"')
-            script.chmod(0o755)
-
-        coyote_jobs = [
-            {
-                "job_name": "test_run_coyote_dryrun",
-                "type": "single",
-                "phase": "dryrun",
-                "script_path": str(dryrun_script),
-                "depends_on": None,
-            },
-            {
-                "job_name": "test_run_coyote_fillcf",
-                "type": "array",
-                "phase": "fillcf",
-                "script_path": str(fillcf_script),
-                "depends_on_job": "test_run_coyote_dryrun",
-                "array_range": "0-7",
-            },
-        ]
-
-        mock_coyote = MockApplication("coyote", coyote_jobs)
+        # Realistic mock jobs similar to CoyoteJob
+        mock_coyote = MockApplication("coyote", _coyote_jobs(script_factory))
         driver.add_application("coyote", mock_coyote)
 
         # Full workflow
@@ -412,8 +472,6 @@ class TestPipelineDriverIntegration:
         assert submission_order[0] == "test_run_coyote_dryrun"  # Dryrun first
         assert submission_order[1] == "test_run_coyote_fillcf"  # Fillcf second
 
-        print("Full pipeline workflow test passed! ✓")
-
 
 if __name__ == "__main__":
     # Run tests directly